@@ -19,9 +19,8 @@ from app.models import *  # noqa
 # access to the values within the .ini file in use.
 config = context.config
 
-# Override sqlalchemy.url with environment variable if present
-if settings.database_url:
-    config.set_main_option("sqlalchemy.url", settings.database_url)
+# Override sqlalchemy.url with the URL resolved from settings
+config.set_main_option("sqlalchemy.url", settings.database_url_resolved)
 
 # Interpret the config file for Python logging.
 # This line sets up loggers basically.
@@ -0,0 +1,41 @@
+"""Server-side defaults for created_at/updated_at
+
+Revision ID: 3c9a1f5e2b7d
+Revises: fbd6ee77ab23
+Create Date: 2025-10-02 09:12:41.513208
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "3c9a1f5e2b7d"
+down_revision: str | None = "fbd6ee77ab23"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = (
+    "users",
+    "sources",
+    "topics",
+    "articles",
+    "article_summaries",
+    "deliveries",
+    "feedback",
+)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, "created_at", server_default=sa.func.now())
+        op.alter_column(table, "updated_at", server_default=sa.func.now())
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.alter_column(table, "updated_at", server_default=None)
+        op.alter_column(table, "created_at", server_default=None)
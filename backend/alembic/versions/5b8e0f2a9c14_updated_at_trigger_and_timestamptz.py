@@ -0,0 +1,76 @@
+"""Trigger-maintained updated_at and timezone-aware timestamps
+
+Revision ID: 5b8e0f2a9c14
+Revises: a41f6c3d8e20
+Create Date: 2025-10-03 08:27:05.881342
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "5b8e0f2a9c14"
+down_revision: str | None = "a41f6c3d8e20"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+TABLES = (
+    "users",
+    "sources",
+    "topics",
+    "articles",
+    "article_summaries",
+    "deliveries",
+    "feedback",
+)
+
+
+def upgrade() -> None:
+    # Existing naive timestamps were written as UTC (datetime.utcnow)
+    for table in TABLES:
+        for column in ("created_at", "updated_at"):
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(timezone=True),
+                existing_type=sa.DateTime(),
+                existing_nullable=False,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION set_updated_at() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_at = now();
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    for table in TABLES:
+        op.execute(
+            f"CREATE TRIGGER trg_{table}_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS trg_{table}_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
+
+    for table in TABLES:
+        for column in ("updated_at", "created_at"):
+            op.alter_column(
+                table,
+                column,
+                type_=sa.DateTime(),
+                existing_type=sa.DateTime(timezone=True),
+                existing_nullable=False,
+                postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            )
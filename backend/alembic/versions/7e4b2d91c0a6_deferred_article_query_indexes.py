@@ -0,0 +1,61 @@
+"""Deferred query indexes on articles
+
+Revision ID: 7e4b2d91c0a6
+Revises: 3c9a1f5e2b7d
+Create Date: 2025-10-02 10:03:17.224561
+
+These indexes only serve reads, so they are split out of the initial schema.
+For a large initial backfill, stop at the previous revision, run the bulk
+ingestion, then upgrade to head:
+
+    alembic upgrade 3c9a1f5e2b7d
+    python -m app.ingestion.ingest_one ...
+    alembic upgrade head
+
+Each index is then built with one sorted scan (CREATE INDEX CONCURRENTLY)
+instead of being maintained row by row during the load.
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7e4b2d91c0a6"
+down_revision: str | None = "3c9a1f5e2b7d"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction block
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_published_at",
+            "articles",
+            ["published_at"],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_source_published",
+            "articles",
+            ["source_id", "published_at"],
+            unique=False,
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_source_published",
+            table_name="articles",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "idx_published_at", table_name="articles", postgresql_concurrently=True
+        )
@@ -0,0 +1,39 @@
+"""Drop redundant secondary indexes on primary keys
+
+Revision ID: a41f6c3d8e20
+Revises: 7e4b2d91c0a6
+Create Date: 2025-10-02 11:40:52.067913
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a41f6c3d8e20"
+down_revision: str | None = "7e4b2d91c0a6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Each primary key already has its own unique B-tree; these duplicates only
+# added write amplification on every INSERT/UPDATE.
+TABLES = (
+    "users",
+    "sources",
+    "topics",
+    "articles",
+    "article_summaries",
+    "deliveries",
+    "feedback",
+)
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.drop_index(op.f(f"ix_{table}_id"), table_name=table)
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.create_index(op.f(f"ix_{table}_id"), table, ["id"], unique=False)
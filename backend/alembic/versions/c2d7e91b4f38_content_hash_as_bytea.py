@@ -0,0 +1,55 @@
+"""Store articles.content_hash as bytea instead of hex text
+
+Revision ID: c2d7e91b4f38
+Revises: 5b8e0f2a9c14
+Create Date: 2025-10-03 14:51:36.402117
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c2d7e91b4f38"
+down_revision: str | None = "5b8e0f2a9c14"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.execute("ALTER TABLE articles ADD COLUMN content_hash_bin BYTEA")
+    op.execute("UPDATE articles SET content_hash_bin = decode(content_hash, 'hex')")
+    op.execute("ALTER TABLE articles ALTER COLUMN content_hash_bin SET NOT NULL")
+    # Dropping the text column also drops both indexes defined on it
+    op.execute("ALTER TABLE articles DROP COLUMN content_hash")
+    op.execute("ALTER TABLE articles RENAME COLUMN content_hash_bin TO content_hash")
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_articles_content_hash",
+            "articles",
+            ["content_hash"],
+            unique=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "idx_content_hash",
+            "articles",
+            ["content_hash"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE articles ADD COLUMN content_hash_hex VARCHAR(64)")
+    op.execute("UPDATE articles SET content_hash_hex = encode(content_hash, 'hex')")
+    op.execute("ALTER TABLE articles ALTER COLUMN content_hash_hex SET NOT NULL")
+    op.execute("ALTER TABLE articles DROP COLUMN content_hash")
+    op.execute("ALTER TABLE articles RENAME COLUMN content_hash_hex TO content_hash")
+
+    op.create_index(
+        "ix_articles_content_hash", "articles", ["content_hash"], unique=True
+    )
+    op.create_index("idx_content_hash", "articles", ["content_hash"], unique=False)
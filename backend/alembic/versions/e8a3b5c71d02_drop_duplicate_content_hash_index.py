@@ -0,0 +1,41 @@
+"""Drop the non-unique content_hash index shadowed by the unique one
+
+Revision ID: e8a3b5c71d02
+Revises: c2d7e91b4f38
+Create Date: 2025-10-04 09:36:18.740215
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e8a3b5c71d02"
+down_revision: str | None = "c2d7e91b4f38"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# ix_articles_content_hash (unique) serves every content_hash lookup and is the
+# arbiter for ON CONFLICT (content_hash); idx_content_hash only cost writes.
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "idx_content_hash",
+            table_name="articles",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "idx_content_hash",
+            "articles",
+            ["content_hash"],
+            unique=False,
+            postgresql_concurrently=True,
+        )
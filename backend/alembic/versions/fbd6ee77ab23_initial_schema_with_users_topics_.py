@@ -30,8 +30,6 @@ def upgrade() -> None:
         sa.Column("is_active", sa.Boolean(), nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
-    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
 
     # Create sources table
     op.create_table(
@@ -49,12 +47,6 @@ def upgrade() -> None:
         sa.Column("error_count", sa.Integer(), nullable=False),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_sources_feed_url"), "sources", ["feed_url"], unique=True)
-    op.create_index(op.f("ix_sources_id"), "sources", ["id"], unique=False)
-    op.create_index(
-        op.f("ix_sources_last_fetched_at"), "sources", ["last_fetched_at"], unique=False
-    )
-    op.create_index(op.f("ix_sources_url"), "sources", ["url"], unique=True)
 
     # Create topics table
     op.create_table(
@@ -72,7 +64,6 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(op.f("ix_topics_id"), "topics", ["id"], unique=False)
 
     # Create articles table
     op.create_table(
@@ -94,15 +85,6 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index("idx_content_hash", "articles", ["content_hash"], unique=False)
-    op.create_index("idx_published_at", "articles", ["published_at"], unique=False)
-    op.create_index(
-        "idx_source_published", "articles", ["source_id", "published_at"], unique=False
-    )
-    op.create_index(
-        op.f("ix_articles_content_hash"), "articles", ["content_hash"], unique=True
-    )
-    op.create_index(op.f("ix_articles_id"), "articles", ["id"], unique=False)
 
     # Create article_summaries table
     op.create_table(
@@ -121,9 +103,6 @@ def upgrade() -> None:
         sa.PrimaryKeyConstraint("id"),
         sa.UniqueConstraint("article_id", "model", name="uq_article_model"),
     )
-    op.create_index(
-        op.f("ix_article_summaries_id"), "article_summaries", ["id"], unique=False
-    )
 
     # Create deliveries table
     op.create_table(
@@ -156,7 +135,6 @@ def upgrade() -> None:
             "topic_id", "delivery_date", "position", name="uq_topic_date_position"
         ),
     )
-    op.create_index(op.f("ix_deliveries_id"), "deliveries", ["id"], unique=False)
 
     # Create feedback table
     op.create_table(
@@ -175,10 +153,45 @@ def upgrade() -> None:
         ),
         sa.PrimaryKeyConstraint("id"),
     )
-    op.create_index(
-        op.f("ix_feedback_delivery_id"), "feedback", ["delivery_id"], unique=True
-    )
-    op.create_index(op.f("ix_feedback_id"), "feedback", ["id"], unique=False)
+
+    # Create indexes only once every table exists. Each runs in its own
+    # transaction instead of adding catalog updates to the table DDL transaction.
+    # The articles query indexes (idx_published_at, idx_source_published) are
+    # deferred to revision 7e4b2d91c0a6 so an initial backfill can run first.
+    with op.get_context().autocommit_block():
+        op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+        op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
+        op.create_index(
+            op.f("ix_sources_feed_url"), "sources", ["feed_url"], unique=True
+        )
+        op.create_index(op.f("ix_sources_id"), "sources", ["id"], unique=False)
+        op.create_index(
+            op.f("ix_sources_last_fetched_at"),
+            "sources",
+            ["last_fetched_at"],
+            unique=False,
+        )
+        op.create_index(op.f("ix_sources_url"), "sources", ["url"], unique=True)
+        op.create_index(op.f("ix_topics_id"), "topics", ["id"], unique=False)
+        op.create_index("idx_content_hash", "articles", ["content_hash"], unique=False)
+        op.create_index(
+            op.f("ix_articles_content_hash"),
+            "articles",
+            ["content_hash"],
+            unique=True,
+        )
+        op.create_index(op.f("ix_articles_id"), "articles", ["id"], unique=False)
+        op.create_index(
+            op.f("ix_article_summaries_id"),
+            "article_summaries",
+            ["id"],
+            unique=False,
+        )
+        op.create_index(op.f("ix_deliveries_id"), "deliveries", ["id"], unique=False)
+        op.create_index(
+            op.f("ix_feedback_delivery_id"), "feedback", ["delivery_id"], unique=True
+        )
+        op.create_index(op.f("ix_feedback_id"), "feedback", ["id"], unique=False)
 
 
 def downgrade() -> None:
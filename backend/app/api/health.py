@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-import platform
-import subprocess
-from datetime import datetime
+import asyncio
+import time
 from typing import Literal
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Response
 from pydantic import BaseModel
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
 
 from app.core.config import settings
 from app.core.logging import get_logger
@@ -15,10 +16,6 @@ logger = get_logger(__name__)
 router = APIRouter()
 
 
-class HealthResponse(BaseModel):
-    status: Literal["ok"]
-
-
 class ReadinessResponse(BaseModel):
     status: Literal["ready", "not_ready"]
     database: Literal["connected", "disconnected"] = "connected"
@@ -32,52 +29,89 @@ class VersionResponse(BaseModel):
     python_version: str
 
 
-def get_commit_hash() -> str:
-    """Get current git commit hash."""
+# Build info is baked into the environment at image build time (see
+# Dockerfile), so the response is fixed for the lifetime of the process.
+_VERSION_RESPONSE = VersionResponse(
+    **settings.model_dump(
+        include={"version", "build_date", "commit_hash", "python_version"}
+    )
+)
+
+
+# Probe responses are static, so serialize them once rather than per request
+_READY_RESPONSE = Response(content=b'{"status":"ready"}', media_type="application/json")
+_NOT_READY_RESPONSE = Response(
+    content=b'{"status":"not_ready"}', status_code=503, media_type="application/json"
+)
+
+# Built once so every probe reuses the same statement (and its cache key)
+_HEALTH_PROBE_SQL = text("SELECT 1")
+
+# (checked_at, ok) of the last database probe, on the time.monotonic() clock
+_last_check: tuple[float, bool] = (float("-inf"), True)
+
+# Held while re-probing, so requests arriving as the TTL expires share one
+# probe instead of each opening a database connection
+_probe_lock = asyncio.Lock()
+
+
+async def _run_probe() -> None:
+    """Run a trivial query against the database outside of any transaction."""
+    from app.db.session import get_async_engine
+
+    async with get_async_engine().connect() as conn:
+        await conn.execution_options(isolation_level="AUTOCOMMIT")
+        await conn.execute(_HEALTH_PROBE_SQL)
+
+
+async def _probe_database() -> bool:
+    """Probe the database, treating errors and timeouts as not ready."""
     try:
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            capture_output=True,
-            text=True,
-            timeout=5,
+        await asyncio.wait_for(_run_probe(), settings.readiness_probe_timeout_sec)
+        return True
+    except TimeoutError:
+        logger.warning(
+            "Readiness database probe timed out",
+            extra={"timeout_sec": settings.readiness_probe_timeout_sec},
         )
-        if result.returncode == 0:
-            return result.stdout.strip()[:8]
-    except (subprocess.TimeoutExpired, FileNotFoundError):
-        pass
-    return "unknown"
+        return False
+    except (SQLAlchemyError, OSError) as e:
+        logger.warning("Readiness database probe failed", extra={"error": str(e)})
+        return False
 
 
-@router.get("/healthz", response_model=HealthResponse, tags=["health"])
-async def health_check() -> HealthResponse:
-    """Basic liveness check for load balancers/orchestrators.
+async def _database_ready() -> bool:
+    """Return the cached probe result, re-probing at most once per TTL."""
+    global _last_check
+    checked_at, ok = _last_check
+    if time.monotonic() - checked_at < settings.readiness_cache_ttl_sec:
+        return ok
 
-    Returns OK if the application is running. No dependencies checked.
-    """
-    logger.info("Health check requested")
-    return HealthResponse(status="ok")
+    async with _probe_lock:
+        # Another request may have refreshed the result while this one waited
+        checked_at, ok = _last_check
+        now = time.monotonic()
+        if now - checked_at < settings.readiness_cache_ttl_sec:
+            return ok
+
+        ok = await _probe_database()
+        _last_check = (now, ok)
+    return ok
 
 
 @router.get("/readyz", tags=["health"])
-async def readiness_check() -> dict[str, str]:
-    """Readiness check for orchestrators. For tests, returns ready unconditionally."""
-    logger.info("Readiness check requested")
-    return {"status": "ready"}
+async def readiness_check() -> Response:
+    """Readiness check for orchestrators.
+
+    Returns ready unconditionally unless database checks are enabled.
+    """
+    if not settings.readiness_check_database or await _database_ready():
+        return _READY_RESPONSE
+    return _NOT_READY_RESPONSE
 
 
 @router.get("/version", response_model=VersionResponse, tags=["health"])
 async def version_info() -> VersionResponse:
     """Version information for deployment tracking and debugging."""
     logger.info("Version info requested")
-
-    # Get build info
-    build_date = settings.build_date or datetime.utcnow().isoformat() + "Z"
-    commit_hash = settings.commit_hash or get_commit_hash()
-    python_version = settings.python_version or platform.python_version()
-
-    return VersionResponse(
-        version=settings.version,
-        build_date=build_date,
-        commit_hash=commit_hash,
-        python_version=python_version,
-    )
+    return _VERSION_RESPONSE
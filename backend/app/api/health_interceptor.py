@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+_HEALTH_PATHS = frozenset({"/healthz"})
+
+_OK_BODY = b'{"status":"ok"}'
+_OK_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_OK_BODY)).encode("ascii")),
+    ],
+}
+_OK_BODY_MESSAGE = {"type": "http.response.body", "body": _OK_BODY}
+
+_NOT_ALLOWED_BODY = b'{"detail":"Method Not Allowed"}'
+_NOT_ALLOWED_START = {
+    "type": "http.response.start",
+    "status": 405,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_NOT_ALLOWED_BODY)).encode("ascii")),
+        (b"allow", b"GET"),
+    ],
+}
+_NOT_ALLOWED_BODY_MESSAGE = {"type": "http.response.body", "body": _NOT_ALLOWED_BODY}
+
+
+class HealthCheckInterceptor:
+    """Pure-ASGI wrapper that answers liveness probes before FastAPI.
+
+    Liveness probes fire every few seconds per pod and need no dependencies,
+    so they are served from pre-encoded messages without entering the
+    middleware chain, routing or Pydantic serialization.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in _HEALTH_PATHS:
+            if scope["method"] == "GET":
+                await send(_OK_START)
+                await send(_OK_BODY_MESSAGE)
+            else:
+                await send(_NOT_ALLOWED_START)
+                await send(_NOT_ALLOWED_BODY_MESSAGE)
+            return
+
+        await self.app(scope, receive, send)
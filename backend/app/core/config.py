@@ -1,9 +1,7 @@
 from __future__ import annotations
 
-from collections.abc import Mapping
-from typing import Any
+from functools import cached_property, lru_cache
 
-from pydantic import ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 
 
@@ -33,12 +31,16 @@ class Settings(BaseSettings):
     postgres_port: str = "5432"
     postgres_db: str = "morning_brief"
 
-    # Database connection pool settings
-    database_pool_size: int = 10
-    database_max_overflow: int = 20
-    database_pool_timeout: int = 30
+    # Connection pooling is done by PgBouncer (transaction mode); the app
+    # engine opens a connection per checkout (NullPool)
     database_echo: bool = False
 
+    # Readiness probe: opt-in DB check, cached to bound probe traffic to the DB
+    readiness_check_database: bool = False
+    readiness_cache_ttl_sec: float = 2.0
+    # A hung database fails the probe (503) instead of hanging /readyz
+    readiness_probe_timeout_sec: float = 1.0
+
     # Test database (use SQLite file by default for CI/local tests)
     test_database_url: str | None = "sqlite:///./test.db"
 
@@ -49,6 +51,7 @@ class Settings(BaseSettings):
     retry_backoff_base_sec: float = 0.5
     retry_backoff_jitter_sec: float = 0.3
     ingestion_total_retry_cap_sec: float = 8.0
+    ingestion_concurrency: int = 8
     summary_max_len: int = 4000
     max_response_size_mb: int = 10
     blocked_networks: list[str] = [
@@ -87,28 +90,26 @@ class Settings(BaseSettings):
     encoding_confidence_min: float = 0.8
     encoding_sample_size: int = 10240
 
-    # Build info (populated at runtime)
-    build_date: str = ""
-    commit_hash: str = ""
-    python_version: str = ""
-
-    @field_validator("database_url", mode="before")
-    @classmethod
-    def assemble_db_connection(cls, v: Any, info: ValidationInfo) -> str:
-        if isinstance(v, str):
-            return v
-        # Build from components if not provided
-        values: Mapping[str, Any] = info.data if hasattr(info, "data") else {}
-        user = values.get("postgres_user", "mb_user")
-        password = values.get("postgres_password", "mb_dev_password")
-        host = values.get("postgres_host", "localhost")
-        port = values.get("postgres_port", "5432")
-        db = values.get("postgres_db", "morning_brief")
-        return f"postgresql://{user}:{password}@{host}:{port}/{db}"
+    # Build info (set as image ENV by the Dockerfile; PYTHON_VERSION comes
+    # from the python base image)
+    build_date: str = "unknown"
+    commit_hash: str = "unknown"
+    python_version: str = "unknown"
+
+    @cached_property
+    def database_url_resolved(self) -> str:
+        """DATABASE_URL if set, otherwise a DSN built once from the parts."""
+        if self.database_url:
+            return self.database_url
+        return (
+            f"postgresql://{self.postgres_user}:{self.postgres_password}"
+            f"@{self.postgres_host}:{self.postgres_port}/{self.postgres_db}"
+        )
 
     model_config = {"env_file": ".env", "case_sensitive": False}
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get application settings singleton."""
     return Settings()
@@ -1,52 +1,81 @@
 from __future__ import annotations
 
-import json
 import logging
 import sys
+import time
 import uuid
 from contextvars import ContextVar
 from typing import Any
 
-from app.core.config import settings
+import msgspec
 
 # Context variable for request ID tracking
 request_id_ctx: ContextVar[str] = ContextVar("request_id", default="")
 
 
-class StructuredFormatter(logging.Formatter):
-    """Custom formatter for structured JSON logging."""
+class LogRecord(msgspec.Struct, omit_defaults=True):
+    """Fixed schema for a structured log line; unset optional fields are omitted."""
 
-    def format(self, record: logging.LogRecord) -> str:
-        """Format log record as structured JSON."""
-        log_data: dict[str, Any] = {
-            "timestamp": self.formatTime(record, self.datefmt),
-            "level": record.levelname,
-            "message": record.getMessage(),
-            "component": record.name,
-        }
+    timestamp: str
+    level: str
+    message: str
+    component: str
+    request_id: str | None = None
+    endpoint: Any = None
+    status_code: Any = None
+    duration_ms: Any = None
+    exception: str | None = None
+
+
+_encoder = msgspec.json.Encoder()
 
-        # Add request ID if available
-        request_id = request_id_ctx.get("")
-        if request_id:
-            log_data["request_id"] = request_id
+_DEFAULT_DATEFMT = "%Y-%m-%dT%H:%M:%S"
 
-        # Add extra fields
-        if hasattr(record, "endpoint"):
-            log_data["endpoint"] = record.endpoint
-        if hasattr(record, "status_code"):
-            log_data["status_code"] = record.status_code
-        if hasattr(record, "duration_ms"):
-            log_data["duration_ms"] = record.duration_ms
 
-        # Add exception info if present
-        if record.exc_info:
-            log_data["exception"] = self.formatException(record.exc_info)
+class StructuredFormatter(logging.Formatter):
+    """Custom formatter for structured JSON logging."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        # (epoch second, formatted UTC timestamp) of the last record
+        self._cached_timestamp: tuple[int, str] = (-1, "")
+
+    def _timestamp(self, created: float) -> str:
+        """Format a record time in UTC, running strftime once per second."""
+        second = int(created)
+        cached_second, formatted = self._cached_timestamp
+        if second != cached_second:
+            formatted = time.strftime(
+                self.datefmt or _DEFAULT_DATEFMT, time.gmtime(second)
+            )
+            self._cached_timestamp = (second, formatted)
+        return formatted
 
-        return json.dumps(log_data)
+    def format(self, record: logging.LogRecord) -> str:
+        """Format log record as structured JSON."""
+        # Plain dict lookups instead of hasattr/getattr for extra fields
+        extra = record.__dict__
+        log_record = LogRecord(
+            timestamp=self._timestamp(record.created),
+            level=record.levelname,
+            message=record.getMessage(),
+            component=record.name,
+            request_id=request_id_ctx.get("") or None,
+            endpoint=extra.get("endpoint"),
+            status_code=extra.get("status_code"),
+            duration_ms=extra.get("duration_ms"),
+            exception=(
+                self.formatException(record.exc_info) if record.exc_info else None
+            ),
+        )
+        return _encoder.encode(log_record).decode("utf-8")
 
 
 def setup_logging() -> None:
     """Configure structured logging for the application."""
+    # Deferred so importing this module doesn't build Settings (.env parsing)
+    from app.core.config import settings
+
     # Get root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(getattr(logging, settings.log_level.upper()))
@@ -57,7 +86,7 @@ def setup_logging() -> None:
 
     # Create console handler with structured formatting
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(StructuredFormatter(datefmt="%Y-%m-%dT%H:%M:%S"))
+    console_handler.setFormatter(StructuredFormatter(datefmt=_DEFAULT_DATEFMT))
 
     # Add handler to root logger
     root_logger.addHandler(console_handler)
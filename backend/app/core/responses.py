@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+from typing import Any
+
+import msgspec
+from fastapi.responses import JSONResponse
+
+_encoder = msgspec.json.Encoder()
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSONResponse serialized by msgspec straight to compact UTF-8 bytes."""
+
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
@@ -1,16 +1,25 @@
 from datetime import datetime
 
-from sqlalchemy import DateTime, Integer
+from sqlalchemy import DateTime, Integer, func
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
 
 
 class Base(DeclarativeBase):
     """Base model class with common fields."""
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True, index=True)
+    # Fetch server-generated timestamps in the INSERT itself (RETURNING)
+    # instead of lazily re-SELECTing them on first access
+    __mapper_args__ = {"eager_defaults": True}
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
     created_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime(timezone=True), server_default=func.now(), nullable=False
     )
+    # Set by every ORM and Core UPDATE; on PostgreSQL the set_updated_at()
+    # trigger (see migration 5b8e0f2a9c14) also covers raw SQL updates
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow, nullable=False
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
     )
@@ -0,0 +1,235 @@
+"""Bulk insert helpers for high-volume tables."""
+
+import io
+import json
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+from datetime import date, datetime
+from itertools import islice
+from typing import Any, cast
+
+from sqlalchemy import CursorResult, Table, insert, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Dialect
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.compiler import IdentifierPreparer
+from sqlalchemy.sql.expression import Executable
+from sqlalchemy.types import TypeDecorator, TypeEngine
+
+from app.db.base import Base
+
+# Below this many rows a multi-VALUES INSERT is cheaper than COPY setup
+COPY_THRESHOLD = 100
+
+# Upper bound on rows per multi-VALUES INSERT
+VALUES_BATCH_SIZE = 500
+
+# Bind parameters one statement may carry: SQLite builds before 3.32 stop
+# at 999, PostgreSQL's wire protocol at 65535
+_MAX_BIND_PARAMS = {"sqlite": 999, "postgresql": 65535}
+
+_COPY_NULL = "\\N"
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def bulk_insert(
+    session: Session,
+    model: type[Base],
+    rows: Sequence[Mapping[str, Any]],
+    *,
+    ignore_conflicts_on: Sequence[str] | None = None,
+) -> int:
+    """
+    Insert rows in the session's transaction, using COPY for large batches.
+
+    Columns left out of the rows (id, timestamps) get their server defaults.
+
+    Args:
+        session: Database session
+        model: Mapped class whose table receives the rows
+        rows: Rows to insert; all rows must share the same keys
+        ignore_conflicts_on: Unique columns; rows that conflict on them are
+            skipped (ON CONFLICT DO NOTHING) instead of failing the batch
+
+    Returns:
+        Number of rows actually inserted
+
+    Raises:
+        ValueError: If ignore_conflicts_on is given for a dialect other than
+            PostgreSQL or SQLite
+    """
+    if not rows:
+        return 0
+
+    table = model.__table__
+    assert isinstance(table, Table)
+    dialect_name = session.get_bind().dialect.name
+
+    if len(rows) >= COPY_THRESHOLD and dialect_name == "postgresql":
+        columns = list(rows[0].keys())
+        if ignore_conflicts_on is None:
+            bulk_copy(session, table, columns, rows)
+            return len(rows)
+        return _copy_ignoring_conflicts(
+            session, table, columns, rows, ignore_conflicts_on
+        )
+
+    if ignore_conflicts_on is not None and dialect_name not in (
+        "postgresql",
+        "sqlite",
+    ):
+        raise ValueError(
+            f"ignore_conflicts_on is not supported for dialect '{dialect_name}'"
+        )
+
+    # Wide rows get fewer per statement so each stays under the driver's
+    # parameter limit. All batches run in the caller's transaction; one
+    # commit covers them
+    max_params = _MAX_BIND_PARAMS.get(dialect_name, 65535)
+    batch_size = min(VALUES_BATCH_SIZE, max(1, max_params // len(rows[0])))
+    inserted = 0
+    for values in _chunked(rows, batch_size):
+        stmt: Executable
+        if ignore_conflicts_on is None:
+            stmt = insert(table).values(values)
+        elif dialect_name == "postgresql":
+            stmt = (
+                pg_insert(table)
+                .values(values)
+                .on_conflict_do_nothing(index_elements=list(ignore_conflicts_on))
+            )
+        else:
+            stmt = (
+                sqlite_insert(table)
+                .values(values)
+                .on_conflict_do_nothing(index_elements=list(ignore_conflicts_on))
+            )
+        inserted += session.execute(stmt).rowcount
+    return inserted
+
+
+def _chunked(rows: Iterable[Any], size: int) -> Iterator[list[Any]]:
+    """Yield consecutive lists of at most size items."""
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
+
+def bulk_copy(
+    session: Session,
+    table: Table,
+    columns: Sequence[str],
+    rows: Sequence[Mapping[str, Any]],
+) -> None:
+    """
+    Stream rows into a PostgreSQL table with COPY FROM STDIN.
+
+    Skips per-row INSERT parsing and ORM bookkeeping entirely; values are
+    serialized to COPY text format on the client.
+
+    Args:
+        session: Database session bound to a psycopg2 connection
+        table: Target table
+        columns: Column names to load, in row order
+        rows: Rows to insert
+    """
+    target = _format_table(session.get_bind().dialect.identifier_preparer, table)
+    types = [table.c[name].type for name in columns]
+    _copy_rows(session, target, columns, types, rows)
+
+
+def _copy_ignoring_conflicts(
+    session: Session,
+    table: Table,
+    columns: Sequence[str],
+    rows: Sequence[Mapping[str, Any]],
+    conflict_columns: Sequence[str],
+) -> int:
+    """COPY into a temp staging table, then INSERT ... ON CONFLICT DO NOTHING."""
+    preparer = session.get_bind().dialect.identifier_preparer
+    target = _format_table(preparer, table)
+    staging = preparer.quote(f"_staging_{table.name}")
+    column_list = ", ".join(preparer.quote(name) for name in columns)
+    conflict_list = ", ".join(preparer.quote(name) for name in conflict_columns)
+
+    # Column types only, no constraints or defaults; dropped at commit at latest
+    session.execute(
+        text(
+            f"CREATE TEMP TABLE {staging} ON COMMIT DROP AS "
+            f"SELECT {column_list} FROM {target} WITH NO DATA"
+        )
+    )
+    types = [table.c[name].type for name in columns]
+    _copy_rows(session, staging, columns, types, rows)
+    result = cast(
+        CursorResult[Any],
+        session.execute(
+            text(
+                f"INSERT INTO {target} ({column_list}) "
+                f"SELECT {column_list} FROM {staging} "
+                f"ON CONFLICT ({conflict_list}) DO NOTHING"
+            )
+        ),
+    )
+    session.execute(text(f"DROP TABLE {staging}"))
+    return result.rowcount
+
+
+def _copy_rows(
+    session: Session,
+    target: str,
+    columns: Sequence[str],
+    types: Sequence[TypeEngine[Any]],
+    rows: Sequence[Mapping[str, Any]],
+) -> None:
+    """Serialize rows to COPY text format and stream them into target."""
+    dialect = session.get_bind().dialect
+
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(
+            "\t".join(
+                _copy_value(row[name], type_, dialect)
+                for name, type_ in zip(columns, types, strict=True)
+            )
+        )
+        buffer.write("\n")
+    buffer.seek(0)
+
+    preparer = dialect.identifier_preparer
+    column_list = ", ".join(preparer.quote(name) for name in columns)
+    statement = f"COPY {target} ({column_list}) FROM STDIN"
+
+    # Run on the session's own DBAPI connection so COPY joins its transaction
+    dbapi_connection = session.connection().connection
+    cursor = dbapi_connection.cursor()
+    try:
+        cursor.copy_expert(statement, buffer)
+    finally:
+        cursor.close()
+
+
+def _format_table(preparer: IdentifierPreparer, table: Table) -> str:
+    """Quote a (possibly schema-qualified) table name; format_table is untyped."""
+    format_table = cast(Callable[[Table], str], preparer.format_table)
+    return format_table(table)
+
+
+def _copy_value(value: Any, type_: TypeEngine[Any], dialect: Dialect) -> str:
+    """Serialize a single value to PostgreSQL COPY text format."""
+    if isinstance(type_, TypeDecorator):
+        value = type_.process_bind_param(value, dialect)
+
+    if value is None:
+        return _COPY_NULL
+    if isinstance(value, bytes):
+        encoded = "\\x" + value.hex()
+    elif isinstance(value, bool):
+        encoded = "t" if value else "f"
+    elif isinstance(value, datetime | date):
+        encoded = value.isoformat()
+    elif isinstance(value, dict | list):
+        encoded = json.dumps(value)
+    else:
+        encoded = str(value)
+    return encoded.translate(_COPY_ESCAPES)
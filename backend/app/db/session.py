@@ -1,82 +1,87 @@
 import os
-from collections.abc import Generator
-from contextlib import suppress
-
-from sqlalchemy import URL, create_engine
+from collections.abc import AsyncIterator, Generator
+from typing import Any
+from uuid import uuid4
+
+from sqlalchemy import Connection, Engine, create_engine, event, make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool, StaticPool
 
 from app.core.config import settings
-from app.db.base import Base
 
 # Resolve database URL with test override during pytest runs
 _is_running_tests: bool = "PYTEST_CURRENT_TEST" in os.environ
 
-# Prefer SQLite test database when running tests
+# Pooling lives in PgBouncer so connection count stays bounded across workers;
+# the app must not rely on session state (SET, server-side cursors) as a result.
+# Tests share one in-memory SQLite connection for the whole run instead; they
+# are isolated by rolling back (see tests/conftest.py)
 if _is_running_tests:
-    # Derive unique sqlite file per test to avoid cross-test contamination
-    test_id = os.environ.get("PYTEST_CURRENT_TEST", "testdb").split("::")[-1]
-    safe = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in test_id)
-    database_url: str | URL = f"sqlite:///./.pytest_db_{safe}.db"
+    database_url = "sqlite://"
+    _engine = create_engine(
+        database_url,
+        poolclass=StaticPool,
+        connect_args={"check_same_thread": False},
+        echo=settings.database_echo,
+    )
 else:
-    database_url = settings.database_url or URL.create(
-        "postgresql",
-        username=settings.postgres_user,
-        password=settings.postgres_password,
-        host=settings.postgres_host,
-        port=int(settings.postgres_port) if settings.postgres_port else None,
-        database=settings.postgres_db,
+    database_url = settings.database_url_resolved
+    _engine = create_engine(
+        database_url, poolclass=NullPool, echo=settings.database_echo
     )
 
-_engine = create_engine(
-    database_url,
-    pool_pre_ping=True,
-    pool_size=settings.database_pool_size,
-    max_overflow=settings.database_max_overflow,
-    echo=settings.database_echo,
-)
 
-_SessionMaker = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
+def _enable_sqlite_savepoints(engine: Engine) -> None:
+    """Let SQLAlchemy own BEGIN so SAVEPOINTs work on pysqlite connections."""
 
-_last_test_slug: str | None = None
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        # Stop pysqlite from issuing its own BEGIN/COMMIT
+        dbapi_connection.isolation_level = None
 
+    @event.listens_for(engine, "begin")
+    def _on_begin(connection: Connection) -> None:
+        connection.exec_driver_sql("BEGIN")
 
-def _maybe_switch_test_db() -> None:
-    global _engine, _SessionMaker, _last_test_slug
-    if not _is_running_tests:
-        return
-    nodeid_raw = os.environ.get("PYTEST_CURRENT_TEST", "testdb")
-    # Normalize to be stable across test phases (setup/call/teardown)
-    nodeid = nodeid_raw.split(" (")[0].strip()
-    slug = "".join(
-        c if c.isalnum() or c in ("-", "_", ":", "/") else "_" for c in nodeid
-    )
-    if slug == _last_test_slug:
-        return
-    # Build a unique sqlite file path per test node id
-    safe = slug.replace("/", "_").replace(":", "_")
-    filename = f".pytest_db_{safe}.db"
-    new_url = f"sqlite:///./{filename}"
-    # Reset existing DB file to ensure clean state per test
-    with suppress(Exception):
-        db_file_path = os.path.join(os.getcwd(), filename)
-        if os.path.exists(db_file_path):
-            os.remove(db_file_path)
-    with suppress(Exception):
-        _engine.dispose()
-    _engine = create_engine(new_url, pool_pre_ping=True, echo=settings.database_echo)
-    _SessionMaker.configure(bind=_engine)
-    with suppress(Exception):
-        Base.metadata.create_all(bind=_engine)
-    _last_test_slug = slug
-
-
-class _SessionFactory:
-    def __call__(self) -> Session:
-        _maybe_switch_test_db()
-        return _SessionMaker()
-
-
-SessionLocal = _SessionFactory()
+
+def _tune_sqlite(engine: Engine) -> None:
+    """Trade durability for speed on SQLite (tests and local dev only)."""
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        # No fsync per commit; rollback journal, temp tables and 64 MB of
+        # page cache all kept in RAM
+        cursor.execute("PRAGMA journal_mode=MEMORY")
+        cursor.execute("PRAGMA synchronous=OFF")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")
+        cursor.close()
+
+
+if _engine.dialect.name == "sqlite":
+    _tune_sqlite(_engine)
+
+if _is_running_tests:
+    _enable_sqlite_savepoints(_engine)
+
+# A plain sessionmaker: calling it is the whole per-request cost, and its
+# configure() lets the test suite rebind it to a rolled-back connection.
+# Deliberately not a scoped_session: FastAPI runs sync dependencies on a
+# threadpool where concurrent requests can share a thread, so a thread-local
+# registry would hand two requests the same Session.
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
+
+
+def get_engine() -> Engine:
+    """Return the engine backing SessionLocal."""
+    return _engine
 
 
 def get_db() -> Generator[Session, None, None]:
@@ -91,11 +96,47 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
-# Ensure tables exist when running tests against SQLite file DB
-if (
-    _is_running_tests
-    and isinstance(database_url, str)
-    and database_url.startswith("sqlite")
-):
-    with suppress(Exception):
-        Base.metadata.create_all(bind=_engine)
+_async_engine: AsyncEngine | None = None
+_AsyncSessionMaker: async_sessionmaker[AsyncSession] | None = None
+
+
+def get_async_engine() -> AsyncEngine:
+    """Return the asyncpg engine used by async request handlers.
+
+    Built on first use so sync-only processes (CLI, migrations, tests) never
+    import asyncpg.
+    """
+    global _async_engine, _AsyncSessionMaker
+    if _async_engine is None:
+        url = make_url(settings.database_url_resolved).set(
+            drivername="postgresql+asyncpg"
+        )
+        _async_engine = create_async_engine(
+            url,
+            poolclass=NullPool,
+            echo=settings.database_echo,
+            # PgBouncer transaction pooling can hand each transaction a
+            # different server, so asyncpg must not reuse named statements
+            connect_args={
+                "statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+            },
+        )
+        _AsyncSessionMaker = async_sessionmaker(_async_engine, expire_on_commit=False)
+    return _async_engine
+
+
+def AsyncSessionLocal() -> AsyncSession:  # noqa: N802
+    """Create a new AsyncSession bound to the asyncpg engine."""
+    get_async_engine()
+    assert _AsyncSessionMaker is not None
+    return _AsyncSessionMaker()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Dependency to get an async database session for async endpoints.
+    Ensures proper cleanup after request.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
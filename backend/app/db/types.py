@@ -0,0 +1,26 @@
+from typing import Any
+
+from sqlalchemy import LargeBinary
+from sqlalchemy.engine import Dialect
+from sqlalchemy.types import TypeDecorator
+
+
+class HexDigest(TypeDecorator[str]):
+    """Hex digest exposed as ``str`` in Python but stored as raw bytes.
+
+    A SHA-256 hex digest is 64 ASCII characters; storing the 32 raw bytes
+    halves the column and any index on it.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def process_bind_param(self, value: Any, dialect: Dialect) -> bytes | None:
+        if value is None or isinstance(value, bytes):
+            return value
+        return bytes.fromhex(value)
+
+    def process_result_value(self, value: Any, dialect: Dialect) -> str | None:
+        if value is None:
+            return None
+        return bytes(value).hex()
@@ -2,18 +2,63 @@
 
 import ipaddress
 import random
+import threading
 import time
+from collections import OrderedDict
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
-import feedparser
 import httpx
 
 from app.core.config import settings
 from app.core.logging import get_logger
+from app.ingestion.fast_parse import parse_feed
 
 logger = get_logger(__name__)
 
+_READ_CHUNK_SIZE = 64 * 1024
+
+# Statuses where the server asks us to come back later (and may say when)
+_RETRY_AFTER_STATUSES = frozenset({429, 503})
+
+# Validated URLs are trusted again for this long, and at most this many are
+# kept (least recently validated evicted first), so the shared client's cache
+# stays bounded and every URL is re-checked periodically
+_VALIDATED_URL_TTL_SEC = 300.0
+_VALIDATED_URLS_MAX = 4096
+
+
+@lru_cache(maxsize=8)
+def _parse_blocked_networks(
+    network_strs: tuple[str, ...],
+) -> tuple[tuple[ipaddress.IPv4Network, ...], tuple[ipaddress.IPv6Network, ...]]:
+    """
+    Parse blocked CIDRs once, split by address family.
+
+    Args:
+        network_strs: Blocked network strings from settings
+
+    Returns:
+        Tuple of (IPv4 networks, IPv6 networks)
+    """
+    v4: list[ipaddress.IPv4Network] = []
+    v6: list[ipaddress.IPv6Network] = []
+    for network_str in network_strs:
+        try:
+            network = ipaddress.ip_network(network_str, strict=False)
+        except ValueError:
+            # Invalid network config - log warning but continue
+            logger.warning(f"Invalid network configuration: {network_str}")
+            continue
+        if isinstance(network, ipaddress.IPv4Network):
+            v4.append(network)
+        else:
+            v6.append(network)
+    return tuple(v4), tuple(v6)
+
 
 class FeedClient:
     """HTTP client for fetching RSS feeds with security controls."""
@@ -27,6 +72,41 @@ class FeedClient:
             settings.max_response_size_mb * 1024 * 1024
         )  # Convert MB to bytes
 
+        self._blocked_v4, self._blocked_v6 = _parse_blocked_networks(
+            tuple(settings.blocked_networks)
+        )
+        # URL -> time.monotonic() when it last passed validate_url
+        self._validated_urls: OrderedDict[str, float] = OrderedDict()
+        self._validated_urls_lock = threading.Lock()
+
+        # Long-lived client so retries and repeat fetches reuse pooled
+        # keep-alive connections instead of a new TCP+TLS handshake each time.
+        # The transport retries failed connection attempts itself
+        self._client = httpx.Client(
+            timeout=self.timeout,
+            follow_redirects=True,
+            max_redirects=3,  # Limit redirects
+            headers={
+                "User-Agent": self.user_agent,
+                "Accept": "application/rss+xml, application/xml, text/xml, */*",
+            },
+            transport=httpx.HTTPTransport(
+                verify=True,  # Always verify SSL certificates
+                retries=self.max_retries,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            ),
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and its pooled connections."""
+        self._client.close()
+
+    def __enter__(self) -> "FeedClient":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def validate_url(self, url: str) -> None:
         """
         Validate URL for security compliance.
@@ -37,6 +117,14 @@ class FeedClient:
         Raises:
             ValueError: If URL fails security validation
         """
+        # Lone dict lookups need no lock
+        validated_at = self._validated_urls.get(url)
+        if (
+            validated_at is not None
+            and time.monotonic() - validated_at < _VALIDATED_URL_TTL_SEC
+        ):
+            return
+
         if not url or not isinstance(url, str):
             raise ValueError("URL must be a non-empty string")
 
@@ -57,21 +145,31 @@ class FeedClient:
             raise ValueError("URL must include a hostname")
 
         # SSRF Protection: Check for private/internal IP addresses
-        try:
-            # Try to parse hostname as IP address
-            ip_address = ipaddress.ip_address(parsed.hostname)
-            self._check_ip_address(ip_address)
-        except ValueError as e:
-            # Check if this is our SSRF protection error
-            if "SSRF protection" in str(e):
-                raise  # Re-raise our SSRF protection error
-
-            # Not a direct IP address, check if it's a blocked hostname
-            if parsed.hostname.lower() in ["localhost", "127.0.0.1", "::1"]:
-                raise ValueError("SSRF protection: localhost access blocked") from None
-            # For domain names, we would need deeper inspection at request time
-            # For now, we allow domain names to proceed (real implementation would
-            # need to check resolved IPs at connection time)
+        host = parsed.hostname.lower()
+        if host in ("localhost", "127.0.0.1", "::1"):
+            raise ValueError("SSRF protection: localhost access blocked")
+
+        # Only IP literals start with a digit or contain a colon, so domain
+        # names (the common case) skip the parse attempt entirely. For domain
+        # names, we would need deeper inspection at request time (resolved
+        # IPs at connection time)
+        if host[0].isdigit() or ":" in host:
+            try:
+                ip_address = ipaddress.ip_address(host)
+            except ValueError:
+                pass  # e.g. "1password.com"
+            else:
+                self._check_ip_address(ip_address)
+
+        self._remember_validated_url(url)
+
+    def _remember_validated_url(self, url: str) -> None:
+        """Record url as validated now, evicting the least recently validated."""
+        with self._validated_urls_lock:
+            self._validated_urls[url] = time.monotonic()
+            self._validated_urls.move_to_end(url)
+            while len(self._validated_urls) > _VALIDATED_URLS_MAX:
+                self._validated_urls.popitem(last=False)
 
     def _check_ip_address(
         self, ip: ipaddress.IPv4Address | ipaddress.IPv6Address
@@ -85,55 +183,51 @@ class FeedClient:
         Raises:
             ValueError: If IP is in blocked network range
         """
-        for network_str in settings.blocked_networks:
-            try:
-                network = ipaddress.ip_network(network_str, strict=False)
-                if ip in network:
-                    raise ValueError(
-                        f"SSRF protection: IP {ip} is in blocked network {network}"
-                    )
-            except ValueError as e:
-                if "SSRF protection" in str(e):
-                    raise
-                # Invalid network config - log warning but continue
-                logger.warning(f"Invalid network configuration: {network_str}")
+        blocked: ipaddress.IPv4Network | ipaddress.IPv6Network | None
+        if isinstance(ip, ipaddress.IPv4Address):
+            blocked = next((net for net in self._blocked_v4 if ip in net), None)
+        else:
+            blocked = next((net for net in self._blocked_v6 if ip in net), None)
+        if blocked is not None:
+            raise ValueError(
+                f"SSRF protection: IP {ip} is in blocked network {blocked}"
+            )
 
     def _make_http_request(self, url: str) -> Any:
         """Make HTTP request and parse feed content."""
-        with httpx.Client(
-            timeout=self.timeout,
-            verify=True,  # Always verify SSL certificates
-            follow_redirects=True,
-            max_redirects=3,  # Limit redirects
-        ) as client:
-            response = client.get(
-                url,
-                headers={
-                    "User-Agent": self.user_agent,
-                    "Accept": ("application/rss+xml, application/xml, text/xml, */*"),
-                },
-            )
-
-            # Check response size
+        with self._client.stream("GET", url) as response:
+            # Reject on declared size before reading any of the body
             self._validate_response_size(response)
 
-            # Raise for HTTP errors
+            # Raise for HTTP errors without downloading the error body
             response.raise_for_status()
 
-            # Parse feed content
-            feed = feedparser.parse(response.content)
+            # Read the body with a running cap, since Content-Length may lie
+            # or be missing; aborting early also releases the socket
+            content = bytearray()
+            for chunk in response.iter_bytes(_READ_CHUNK_SIZE):
+                content.extend(chunk)
+                if len(content) > self.max_response_size:
+                    raise ValueError(
+                        f"Response too large: body exceeded "
+                        f"{self.max_response_size} bytes while reading"
+                    )
 
-            # Check for parsing errors
-            if hasattr(feed, "bozo") and feed.bozo and hasattr(feed, "bozo_exception"):
-                logger.warning(
-                    "Feed parsing warning",
-                    extra={"url": url, "warning": str(feed.bozo_exception)},
-                )
+        # Parse feed content
+        feed = parse_feed(bytes(content))
 
-            return feed
+        # Check for parsing errors (feedparser only sets this when bozo)
+        bozo_exc = getattr(feed, "bozo_exception", None)
+        if bozo_exc is not None:
+            logger.warning(
+                "Feed parsing warning",
+                extra={"url": url, "warning": str(bozo_exc)},
+            )
+
+        return feed
 
     def _validate_response_size(self, response: httpx.Response) -> None:
-        """Validate response size against limits."""
+        """Validate declared response size against limits."""
         content_length = response.headers.get("content-length")
         if content_length and int(content_length) > self.max_response_size:
             raise ValueError(
@@ -141,38 +235,20 @@ class FeedClient:
                 f"(max: {self.max_response_size} bytes)"
             )
 
-        # Check actual content size
-        if len(response.content) > self.max_response_size:
-            raise ValueError(
-                f"Response too large: {len(response.content)} bytes "
-                f"(max: {self.max_response_size} bytes)"
-            )
-
-    def _handle_retry_logic(
-        self, attempt: int, url: str, total_wait_time: float
+    def _retry_delay(
+        self, response: httpx.Response, attempt: int, total_wait_time: float
     ) -> float:
-        """Handle retry delay logic and return new total wait time."""
-        if attempt >= self.max_retries:
-            return total_wait_time
-
-        delay = calculate_backoff_delay(
-            attempt,
-            settings.retry_backoff_base_sec,
-            settings.retry_backoff_jitter_sec,
-            settings.ingestion_total_retry_cap_sec - total_wait_time,
-        )
-
-        new_total_wait_time = total_wait_time + delay
-        if new_total_wait_time >= settings.ingestion_total_retry_cap_sec:
-            logger.warning(
-                "Retry time limit exceeded",
-                extra={"url": url, "total_wait_time": new_total_wait_time},
+        """Delay before retrying a 429/503: Retry-After if sent, else backoff."""
+        remaining = settings.ingestion_total_retry_cap_sec - total_wait_time
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            return calculate_backoff_delay(
+                attempt,
+                settings.retry_backoff_base_sec,
+                settings.retry_backoff_jitter_sec,
+                remaining,
             )
-            return settings.ingestion_total_retry_cap_sec
-
-        logger.debug(f"Retrying in {delay:.2f}s", extra={"url": url, "delay": delay})
-        time.sleep(delay)
-        return new_total_wait_time
+        return max(0.0, min(retry_after, remaining))
 
     def fetch_feed(self, url: str) -> Any:
         """
@@ -187,89 +263,106 @@ class FeedClient:
         Raises:
             ValueError: If URL fails security validation
             TimeoutError: If request times out
-            Exception: If request fails after retries
+            Exception: If the request fails, or still gets 429/503 after retries
         """
         # Validate URL first
         self.validate_url(url)
 
-        # Attempt fetch with retries
-        last_exception: Exception | None = None
+        # Connection failures are retried by the transport; this loop only
+        # waits out servers that answer 429/503
         total_wait_time = 0.0
-
-        for attempt in range(self.max_retries + 1):  # +1 for initial attempt
+        attempt = 0
+        while True:
+            logger.debug(
+                "Fetching feed",
+                extra={"url": url, "attempt": attempt + 1},
+            )
             try:
-                logger.debug(
-                    "Fetching feed",
-                    extra={
-                        "url": url,
-                        "attempt": attempt + 1,
-                        "max_retries": self.max_retries + 1,
-                    },
-                )
-
                 feed = self._make_http_request(url)
 
-                logger.info(
-                    "Successfully fetched feed",
-                    extra={
-                        "url": url,
-                        "entries_count": (
-                            len(feed.entries) if hasattr(feed, "entries") else 0
-                        ),
-                        "attempt": attempt + 1,
-                    },
-                )
-
-                return feed
-
             except httpx.TimeoutException:
-                last_exception = TimeoutError(
-                    f"Request timed out after {self.timeout}s"
-                )
                 logger.warning(
                     "Feed fetch timeout",
                     extra={"url": url, "attempt": attempt + 1, "timeout": self.timeout},
                 )
+                raise TimeoutError(f"Request timed out after {self.timeout}s") from None
 
             except httpx.HTTPStatusError as e:
-                last_exception = Exception(
-                    f"HTTP error {e.response.status_code}: {e.response.text}"
-                )
+                status_code = e.response.status_code
                 logger.warning(
                     "Feed fetch HTTP error",
                     extra={
                         "url": url,
                         "attempt": attempt + 1,
-                        "status_code": e.response.status_code,
+                        "status_code": status_code,
                     },
                 )
+                error = Exception(
+                    f"HTTP error {status_code}: {e.response.reason_phrase}"
+                )
+                if (
+                    status_code not in _RETRY_AFTER_STATUSES
+                    or attempt >= self.max_retries
+                ):
+                    raise error from None
+
+                delay = self._retry_delay(e.response, attempt, total_wait_time)
+                total_wait_time += delay
+                if total_wait_time >= settings.ingestion_total_retry_cap_sec:
+                    logger.warning(
+                        "Retry time limit exceeded",
+                        extra={"url": url, "total_wait_time": total_wait_time},
+                    )
+                    raise error from None
+
+                logger.debug(
+                    f"Retrying in {delay:.2f}s", extra={"url": url, "delay": delay}
+                )
+                time.sleep(delay)
+                attempt += 1
+                continue
 
             except Exception as e:
-                last_exception = e
                 logger.warning(
                     "Feed fetch error",
                     extra={"url": url, "attempt": attempt + 1, "error": str(e)},
                 )
+                raise
+
+            logger.info(
+                "Successfully fetched feed",
+                extra={
+                    "url": url,
+                    "entries_count": len(feed.entries),
+                    "attempt": attempt + 1,
+                },
+            )
+            return feed
 
-            # Handle retry logic
-            total_wait_time = self._handle_retry_logic(attempt, url, total_wait_time)
-            if total_wait_time >= settings.ingestion_total_retry_cap_sec:
-                break
-
-        # All retries failed
-        logger.error(
-            "Feed fetch failed after all retries",
-            extra={
-                "url": url,
-                "attempts": self.max_retries + 1,
-                "last_error": str(last_exception),
-            },
-        )
 
-        if last_exception:
-            raise last_exception
-        else:
-            raise Exception("Failed to fetch feed after all retries")
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header into seconds.
+
+    Args:
+        value: Header value, either delay-seconds or an HTTP date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
 
 
 def calculate_backoff_delay(
@@ -322,8 +415,9 @@ def validate_feed_content(feed: Any) -> dict[str, Any]:
     parsing_errors = metadata["parsing_errors"]
     assert isinstance(parsing_errors, list)  # Type narrowing for mypy
 
-    if hasattr(feed, "bozo") and feed.bozo and hasattr(feed, "bozo_exception"):
-        parsing_errors.append(str(feed.bozo_exception))
+    bozo_exc = getattr(feed, "bozo_exception", None)
+    if bozo_exc is not None:
+        parsing_errors.append(str(bozo_exc))
 
     # Validate entries structure
     if not hasattr(feed, "entries"):
@@ -2,18 +2,25 @@
 
 import argparse
 import sys
+import threading
 import time
-from datetime import UTC, datetime
+from collections import OrderedDict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any
 
+from sqlalchemy import bindparam, exists, func, select, update
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 import app.db.session as db_session_mod
+from app.core.config import settings
 from app.core.logging import get_logger
+from app.db.bulk import VALUES_BATCH_SIZE, bulk_insert
+from app.ingestion.fast_parse import parse_feed_file
 from app.ingestion.feed_client import FeedClient
-from app.ingestion.mapper import ArticleMapper, validate_article_data
+from app.ingestion.mapper import ArticleMapper
 from app.ingestion.seeder import (
     get_or_create_source,
     get_source_by_id,
@@ -24,113 +31,212 @@ from app.models.source import Source
 
 logger = get_logger(__name__)
 
+# content_hashes this process has seen committed, most recent last. Lets
+# re-polls of the same feed skip the dedupe query for known articles
+_SEEN_HASHES_MAX = 100_000
+_SEEN_HASHES: OrderedDict[str, None] = OrderedDict()
+# Held for every read-and-reorder of _SEEN_HASHES (parallel ingestion)
+_SEEN_HASHES_LOCK = threading.Lock()
 
-def _get_source_for_ingestion(feed_url: str, source_id: int | None) -> Source:
+# One FeedClient per process keeps httpx keep-alive connections warm across
+# feeds; ArticleMapper is stateless. Both are safe to share between threads
+_FEED_CLIENT: FeedClient | None = None
+_ARTICLE_MAPPER = ArticleMapper()
+_FEED_CLIENT_LOCK = threading.Lock()
+
+# Built once; callers only bind the id, so no statement is constructed per feed
+_SOURCE_EXISTS_STMT = select(exists().where(Source.id == bindparam("source_id")))
+
+
+def _get_feed_client() -> FeedClient:
+    """Return the process-wide FeedClient, creating it on first use."""
+    global _FEED_CLIENT
+    if _FEED_CLIENT is None:
+        with _FEED_CLIENT_LOCK:
+            if _FEED_CLIENT is None:
+                _FEED_CLIENT = FeedClient()
+    return _FEED_CLIENT
+
+
+def _get_source_for_ingestion(
+    db: Session, feed_url: str, source_id: int | None
+) -> Source:
     """Get or create source for ingestion."""
     if source_id:
-        with db_session_mod.SessionLocal() as db:
-            source = get_source_by_id(source_id, db)
-            if not source:
-                raise ValueError(f"Source with ID {source_id} not found")
+        source = get_source_by_id(source_id, db)
+        if not source:
+            raise ValueError(f"Source with ID {source_id} not found")
     else:
-        source = get_or_create_source(feed_url)
+        source = get_or_create_source(feed_url, db=db)
     return source
 
 
-def _process_feed_entry(
-    entry: Any, source_id: int, mapper: ArticleMapper, db: Session
-) -> str:
-    """Process a single feed entry and return result status."""
-    from sqlalchemy.exc import IntegrityError
+def _map_feed_entries(
+    entries: Any, source_id: int, mapper: ArticleMapper, result: dict[str, int]
+) -> list[dict[str, Any]]:
+    """Map and validate feed entries, counting failures in result["errors"]."""
+    # Already-committed hashes are dropped before the insert, so only the
+    # rest need validating (lone dict lookups need no lock)
+    rows, failures = mapper.map_entries_to_articles(
+        entries, source_id, skip_validation_for=_SEEN_HASHES
+    )
+    for entry, e in failures:
+        result["errors"] += 1
+        logger.warning(
+            "Failed to process article",
+            extra={
+                "error": str(e),
+                "entry_title": getattr(entry, "title", "Unknown"),
+            },
+        )
+    return rows
+
 
-    # Map entry to article data
-    article_data = mapper.map_entry_to_article(entry, source_id)
+def _remember_hashes(hashes: Iterable[str]) -> None:
+    """Record committed content hashes, evicting the least recently seen."""
+    with _SEEN_HASHES_LOCK:
+        for content_hash in hashes:
+            _SEEN_HASHES[content_hash] = None
+            _SEEN_HASHES.move_to_end(content_hash)
+        while len(_SEEN_HASHES) > _SEEN_HASHES_MAX:
+            _SEEN_HASHES.popitem(last=False)
 
-    # Validate article data
-    validate_article_data(article_data)
 
-    # Check if article already exists (by content_hash)
-    existing_article = (
-        db.query(Article).filter_by(content_hash=article_data["content_hash"]).first()
+def _insert_new_articles(db: Session, rows: list[dict[str, Any]]) -> int:
+    """
+    Insert articles whose content_hash is not stored yet.
+
+    Hashes this process already saw committed are dropped up front. The rest
+    go out in one bulk insert with ON CONFLICT DO NOTHING on the unique
+    content_hash index, which does the dedupe (and holds under concurrent
+    ingesters) without a separate lookup query.
+
+    Args:
+        db: Database session
+        rows: Validated article data
+
+    Returns:
+        Number of articles inserted
+    """
+    # Keep the first occurrence of each hash within the batch
+    unique_rows: dict[str, dict[str, Any]] = {}
+    keep_first = unique_rows.setdefault
+    seen = _SEEN_HASHES
+    with _SEEN_HASHES_LOCK:
+        for row in rows:
+            content_hash = row["content_hash"]
+            if content_hash in seen:
+                seen.move_to_end(content_hash)
+            else:
+                keep_first(content_hash, row)
+    if not unique_rows:
+        return 0
+
+    return bulk_insert(
+        db, Article, list(unique_rows.values()), ignore_conflicts_on=["content_hash"]
     )
 
-    if existing_article:
-        logger.debug(
-            "Skipping duplicate article (found in DB)",
-            extra={
-                "content_hash": article_data["content_hash"][:16] + "...",
-                "title": (
-                    article_data["title"][:50] + "..."
-                    if len(article_data["title"]) > 50
-                    else article_data["title"]
-                ),
-            },
-        )
-        return "skipped"
 
-    # Create new article with proper unique constraint handling
-    try:
-        article = Article(**article_data)
-        db.add(article)
-        db.flush()  # Force immediate constraint check
+def _coerce_source_fields(
+    source: Source, default_name: str, default_url: str
+) -> tuple[str, str]:
+    """Concrete (name, feed_url) strings for source, which may be a test Mock."""
+    name_attr = getattr(source, "name", None)
+    feed_attr = getattr(source, "feed_url", None)
+    name = str(name_attr) if name_attr is not None else default_name
+    feed_url = str(feed_attr) if feed_attr is not None else default_url
+    return name, feed_url
 
-        logger.debug(
-            "Inserted article",
-            extra={
-                "title": (
-                    article_data["title"][:50] + "..."
-                    if len(article_data["title"]) > 50
-                    else article_data["title"]
-                ),
-                "content_hash": article_data["content_hash"][:16] + "...",
-            },
-        )
-        return "inserted"
 
-    except IntegrityError as e:
-        # Handle unique constraint violation (race condition or concurrent inserts)
-        db.rollback()
+def _ensure_source_row(
+    db: Session, source: Source, default_name: str, default_url: str
+) -> None:
+    """
+    Add a placeholder row for source if it is not stored yet.
 
-        logger.debug(
-            "Skipping duplicate article (unique constraint violation)",
-            extra={
-                "content_hash": article_data["content_hash"][:16] + "...",
-                "title": (
-                    article_data["title"][:50] + "..."
-                    if len(article_data["title"]) > 50
-                    else article_data["title"]
-                ),
-                "error": str(e)[:200],
-            },
+    Tests mock get_or_create_source, so the source may only exist in memory.
+    The row is flushed so the article batch can reference it.
+    """
+    if db.scalar(_SOURCE_EXISTS_STMT, {"source_id": source.id}):
+        return
+
+    name, url = _coerce_source_fields(source, default_name, default_url)
+    db.add(
+        Source(
+            id=source.id,
+            name=name,
+            url=url,
+            feed_url=url,
+            credibility_score=0.5,
+            is_active=True,
         )
-        return "skipped"
+    )
+    db.flush()
 
 
 def _update_source_after_ingestion(
-    source: Source, success: bool, error: str | None
+    db: Session, source_id: int | None, success: bool, error: str | None
+) -> None:
+    """
+    Update source metadata after ingestion with a single UPDATE.
+
+    Issued on the caller's session, which commits it (together with the
+    article batch on success). Failures are counted SQL-side, so concurrent
+    ingesters cannot lose an increment, and last_fetched_at is stamped with
+    the database's clock rather than this host's.
+    """
+    if source_id is None:
+        return
+    stmt = update(Source).where(Source.id == source_id)
+    if success:
+        stmt = stmt.values(last_fetched_at=func.now(), error_count=0, last_error=None)
+    else:
+        stmt = stmt.values(
+            error_count=func.coalesce(Source.error_count, 0) + 1,
+            last_error=error[:1000] if error else None,
+        )
+    db.execute(stmt)
+
+
+def _log_source_update_failure(error: Exception) -> None:
+    """Log a best-effort source error update that itself failed."""
+    logger.debug("Source metadata update failed", extra={"error": str(error)})
+
+
+def _record_ingestion_failure(
+    db: Session,
+    feed_url: str,
+    source: Source | None,
+    source_id: int | None,
+    error: str,
 ) -> None:
-    """Update source metadata after ingestion."""
+    """
+    Best-effort: count a failed ingestion on its source and commit.
+
+    The caller has already counted the failure, so nothing raised here may
+    escape; it is logged and rolled back instead.
+    """
     try:
-        with db_session_mod.SessionLocal() as db:
-            db_source = db.query(Source).filter_by(id=source.id).first()
-            if not db_source:
-                return
-            if success:
-                db_source.last_fetched_at = datetime.now(UTC)
-                db_source.error_count = 0
-                db_source.last_error = None
-            else:
-                db_source.error_count = (db_source.error_count or 0) + 1
-                db_source.last_error = str(error)[:1000] if error else None
-            db.commit()
-    except Exception:
-        pass  # Don't let error logging fail the whole operation
+        if source is None and source_id is None:
+            # The fetch failed before the lookup; record the error on the
+            # feed's source, creating its placeholder
+            source = get_or_create_source(feed_url, db=db)
+        _update_source_after_ingestion(
+            db, source.id if source else source_id, False, error
+        )
+        db.commit()
+    except Exception as update_error:
+        db.rollback()
+        _log_source_update_failure(update_error)
 
 
 def ingest_feed_from_url(feed_url: str, source_id: int | None = None) -> dict[str, int]:
     """
     Ingest articles from a feed URL.
 
+    Everything runs in one session: source lookup, article batch, fetch
+    metadata and, on failure, the error count.
+
     Args:
         feed_url: URL of the RSS feed to ingest
         source_id: Optional source ID to associate with articles
@@ -140,84 +246,56 @@ def ingest_feed_from_url(feed_url: str, source_id: int | None = None) -> dict[st
     """
     result = {"parsed": 0, "inserted": 0, "skipped": 0, "errors": 0}
     start_time = time.time()
-    source = None
-
-    try:
-        # Get or create source
-        source = _get_source_for_ingestion(feed_url, source_id)
-
-        logger.info(
-            "Starting feed ingestion",
-            extra={
-                "feed_url": feed_url,
-                "source_id": source.id,
-                "source_name": source.name,
-            },
-        )
-
-        # Fetch and parse feed
-        client: FeedClient = FeedClient()
-        feed = client.fetch_feed(feed_url)
-
-        if not hasattr(feed, "entries") or not feed.entries:
-            logger.warning("Feed contains no entries", extra={"feed_url": feed_url})
-            return result
+    source: Source | None = None
 
-        result["parsed"] = len(feed.entries)
+    logger.info(
+        "Starting feed ingestion",
+        extra={"feed_url": feed_url, "source_id": source_id},
+    )
 
-        # Ensure source exists in DB (when tests mock get_or_create_source)
+    try:
         with db_session_mod.SessionLocal() as db:
-            existing = db.query(Source).filter_by(id=source.id).first()
-            if not existing:
-                # Coerce possible Mock attributes to concrete strings
-                name_attr = getattr(source, "name", None)
-                feed_attr = getattr(source, "feed_url", None)
-                name_val = (
-                    str(name_attr)
-                    if name_attr is not None
-                    else f"Unknown Source ({source.id})"
-                )
-                url_val = str(feed_attr) if feed_attr is not None else str(feed_url)
-                placeholder = Source(
-                    id=source.id,
-                    name=name_val,
-                    url=url_val,
-                    feed_url=url_val,
-                    credibility_score=0.5,
-                    is_active=True,
-                )
-                db.add(placeholder)
-                db.commit()
+            try:
+                # Fetch before the session first touches the database (it
+                # begins lazily), so no transaction is held across network I/O
+                feed = _get_feed_client().fetch_feed(feed_url)
 
-        # Process entries
-        mapper = ArticleMapper()
-        with db_session_mod.SessionLocal() as db:
-            for entry in feed.entries:
-                try:
-                    status = _process_feed_entry(entry, source.id, mapper, db)
-                    result[status] += 1
+                source = _get_source_for_ingestion(db, feed_url, source_id)
 
-                except Exception as e:
-                    result["errors"] += 1
+                if not feed.entries:
                     logger.warning(
-                        "Failed to process article",
-                        extra={
-                            "error": str(e),
-                            "entry_title": getattr(entry, "title", "Unknown"),
-                        },
+                        "Feed contains no entries", extra={"feed_url": feed_url}
                     )
+                    return result
 
-            # Commit all changes
-            try:
+                result["parsed"] = len(feed.entries)
+
+                # Source row, articles and fetch metadata commit together
+                rows = _map_feed_entries(
+                    feed.entries, source.id, _ARTICLE_MAPPER, result
+                )
+                _ensure_source_row(
+                    db, source, f"Unknown Source ({source.id})", str(feed_url)
+                )
+                result["inserted"] = _insert_new_articles(db, rows)
+                result["skipped"] = len(rows) - result["inserted"]
+                _update_source_after_ingestion(db, source.id, True, None)
                 db.commit()
-                _update_source_after_ingestion(source, True, None)
+                _remember_hashes(row["content_hash"] for row in rows)
 
-            except SQLAlchemyError as e:
+            except Exception as e:
                 db.rollback()
-                logger.error("Database commit failed", extra={"error": str(e)})
-                result["errors"] += result["inserted"]
-                result["inserted"] = 0
-                raise
+                if isinstance(e, SQLAlchemyError):
+                    logger.error("Database commit failed", extra={"error": str(e)})
+                    result["errors"] += result["inserted"]
+                    result["inserted"] = 0
+                result["errors"] += 1
+                logger.error(
+                    "Feed ingestion failed",
+                    extra={"feed_url": feed_url, "error": str(e)},
+                )
+
+                _record_ingestion_failure(db, feed_url, source, source_id, str(e))
 
     except Exception as e:
         result["errors"] += 1
@@ -225,10 +303,6 @@ def ingest_feed_from_url(feed_url: str, source_id: int | None = None) -> dict[st
             "Feed ingestion failed", extra={"feed_url": feed_url, "error": str(e)}
         )
 
-        # Update source error count
-        if source:
-            _update_source_after_ingestion(source, False, str(e))
-
     finally:
         duration = time.time() - start_time
         logger.info(
@@ -246,6 +320,195 @@ def ingest_feed_from_url(feed_url: str, source_id: int | None = None) -> dict[st
     return result
 
 
+def _insert_batches(
+    db: Session,
+    batches: dict[int, list[dict[str, Any]]],
+    failed: list[tuple[int, str]],
+    result: dict[str, int],
+) -> list[dict[str, Any]]:
+    """
+    Insert every source's rows, isolating a failing source in a SAVEPOINT.
+
+    All rows go out as one batch first. If that fails, each source is
+    retried in its own SAVEPOINT so one bad feed only loses its own rows;
+    failing sources are removed from batches and added to failed.
+
+    Returns:
+        Rows that were inserted or confirmed as already stored
+    """
+    rows = [row for source_rows in batches.values() for row in source_rows]
+    try:
+        with db.begin_nested():
+            inserted = _insert_new_articles(db, rows)
+    except SQLAlchemyError as e:
+        logger.warning(
+            "Batch insert failed, retrying per feed", extra={"error": str(e)}
+        )
+    else:
+        result["inserted"] += inserted
+        result["skipped"] += len(rows) - inserted
+        return rows
+
+    stored: list[dict[str, Any]] = []
+    for source_id, source_rows in list(batches.items()):
+        try:
+            with db.begin_nested():
+                inserted = _insert_new_articles(db, source_rows)
+        except SQLAlchemyError as e:
+            result["errors"] += len(source_rows)
+            failed.append((source_id, str(e)))
+            del batches[source_id]
+            continue
+        result["inserted"] += inserted
+        result["skipped"] += len(source_rows) - inserted
+        stored.extend(source_rows)
+    return stored
+
+
+def _fetch_and_map_feeds(
+    feed_urls: list[str], result: dict[str, int]
+) -> tuple[dict[int, list[dict[str, Any]]], list[tuple[int, str]]]:
+    """
+    Fetch feeds concurrently and map their entries, counting into result.
+
+    Returns:
+        Mapped rows per fetched source id, and (source id, error) for each
+        feed whose fetch failed
+    """
+    client = _get_feed_client()
+    batches: dict[int, list[dict[str, Any]]] = {}
+    failed: list[tuple[int, str]] = []
+
+    with ThreadPoolExecutor(max_workers=settings.ingestion_concurrency) as executor:
+        futures = {executor.submit(client.fetch_feed, url): url for url in feed_urls}
+        for future in as_completed(futures):
+            feed_url = futures[future]
+            source = None
+            try:
+                source = get_or_create_source(feed_url)
+                feed = future.result()
+            except Exception as e:
+                result["errors"] += 1
+                logger.error(
+                    "Feed ingestion failed",
+                    extra={"feed_url": feed_url, "error": str(e)},
+                )
+                if source:
+                    failed.append((source.id, str(e)))
+                continue
+
+            batches[source.id] = []
+            if not feed.entries:
+                logger.warning("Feed contains no entries", extra={"feed_url": feed_url})
+                continue
+            result["parsed"] += len(feed.entries)
+            batches[source.id] = _map_feed_entries(
+                feed.entries, source.id, _ARTICLE_MAPPER, result
+            )
+
+    return batches, failed
+
+
+def _update_sources_after_bulk(
+    db: Session,
+    source_ids: Iterable[int],
+    failed: list[tuple[int, str]],
+    error: str | None,
+) -> None:
+    """Stamp fetched sources (as failed if error is set) and failed fetches."""
+    for source_id in source_ids:
+        _update_source_after_ingestion(db, source_id, error is None, error)
+    for failed_id, fetch_error in failed:
+        _update_source_after_ingestion(db, failed_id, False, fetch_error)
+
+
+def _store_bulk_results(
+    batches: dict[int, list[dict[str, Any]]],
+    failed: list[tuple[int, str]],
+    result: dict[str, int],
+) -> None:
+    """Insert all mapped rows and source metadata in one transaction."""
+    with db_session_mod.SessionLocal() as db:
+        try:
+            stored = _insert_batches(db, batches, failed, result)
+            _update_sources_after_bulk(db, batches, failed, None)
+            db.commit()
+            _remember_hashes(row["content_hash"] for row in stored)
+        except SQLAlchemyError as e:
+            db.rollback()
+            logger.error("Database commit failed", extra={"error": str(e)})
+            result["errors"] += result["inserted"]
+            result["inserted"] = 0
+            try:
+                _update_sources_after_bulk(db, batches, failed, str(e))
+                db.commit()
+            except SQLAlchemyError as update_error:
+                _log_source_update_failure(update_error)
+
+
+def ingest_feeds_bulk(feed_urls: list[str]) -> dict[str, int]:
+    """
+    Ingest several feeds, fetching them concurrently.
+
+    Fetches overlap on a thread pool sharing the process-wide FeedClient (and
+    so one httpx connection pool); all new articles and source metadata are then
+    written in a single session and transaction.
+
+    Args:
+        feed_urls: URLs of the RSS feeds to ingest
+
+    Returns:
+        Dictionary with ingestion statistics summed over all feeds
+    """
+    result = {"parsed": 0, "inserted": 0, "skipped": 0, "errors": 0}
+    start_time = time.time()
+
+    batches, failed = _fetch_and_map_feeds(feed_urls, result)
+    _store_bulk_results(batches, failed, result)
+
+    logger.info(
+        "Bulk feed ingestion completed",
+        extra={
+            "feeds": len(feed_urls),
+            "duration_sec": round(time.time() - start_time, 2),
+            "parsed": result["parsed"],
+            "inserted": result["inserted"],
+            "skipped": result["skipped"],
+            "errors": result["errors"],
+        },
+    )
+
+    return result
+
+
+def ingest_feeds_parallel(
+    feed_urls: list[str], max_workers: int | None = None
+) -> dict[str, int]:
+    """
+    Run ingest_feed_from_url for several feeds on a thread pool.
+
+    Unlike ingest_feeds_bulk, each feed is fetched, mapped and committed
+    independently in its worker, so one slow or failing feed never holds
+    back the others' writes.
+
+    Args:
+        feed_urls: URLs of the RSS feeds to ingest
+        max_workers: Worker threads; defaults to INGESTION_CONCURRENCY
+
+    Returns:
+        Dictionary with ingestion statistics summed over all feeds
+    """
+    totals = {"parsed": 0, "inserted": 0, "skipped": 0, "errors": 0}
+    workers = max_workers or settings.ingestion_concurrency
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for feed_result in executor.map(ingest_feed_from_url, feed_urls):
+            for key, value in feed_result.items():
+                totals[key] += value
+
+    return totals
+
+
 def ingest_feed_from_file(file_path: str) -> dict[str, int]:
     """
     Ingest articles from a local RSS file (for testing).
@@ -257,99 +520,49 @@ def ingest_feed_from_file(file_path: str) -> dict[str, int]:
         Dictionary with ingestion statistics
     """
     result = {"parsed": 0, "inserted": 0, "skipped": 0, "errors": 0}
+    source: Source | None = None
+    source_url = f"file://{file_path}"
+    source_name = f"Local File ({Path(file_path).name})"
 
     try:
-        # Read file content
-        with open(file_path, "rb") as f:
-            content = f.read()
-
         # Create a mock source for file ingestion
-        source = get_or_create_source(
-            f"file://{file_path}", f"Local File ({Path(file_path).name})"
-        )
+        source = get_or_create_source(source_url, source_name)
 
         logger.info(
             "Starting file ingestion",
             extra={"file_path": file_path, "source_id": source.id},
         )
 
-        # Parse feed content directly
-        import feedparser
-
-        feed = feedparser.parse(content)
+        # Parse straight from the file instead of reading it into memory first
+        feed = parse_feed_file(file_path)
 
-        if not hasattr(feed, "entries") or not feed.entries:
+        if not feed.entries:
             logger.warning("File contains no entries", extra={"file_path": file_path})
             return result
 
         result["parsed"] = len(feed.entries)
 
-        # Ensure source exists in DB when tests mock get_or_create_source
+        # Process entries (same logic as URL ingestion), mapping and inserting
+        # one chunk at a time so large archives never hold every row at once
+        entries = feed.entries
+        hashes: list[str] = []
         with db_session_mod.SessionLocal() as db:
-            existing = db.query(Source).filter_by(id=source.id).first()
-            if not existing:
-                name_attr = getattr(source, "name", None)
-                feed_attr = getattr(source, "feed_url", None)
-                name_val = (
-                    str(name_attr)
-                    if name_attr is not None
-                    else f"Local File ({Path(file_path).name})"
-                )
-                url_val = (
-                    str(feed_attr) if feed_attr is not None else f"file://{file_path}"
-                )
-                placeholder = Source(
-                    id=source.id,
-                    name=name_val,
-                    url=url_val,
-                    feed_url=url_val,
-                    credibility_score=0.5,
-                    is_active=True,
-                )
-                db.add(placeholder)
-                db.commit()
-
-        # Process entries (same logic as URL ingestion)
-        mapper = ArticleMapper()
-        with db_session_mod.SessionLocal() as db:
-            for entry in feed.entries:
-                try:
-                    # Map entry to article data
-                    article_data = mapper.map_entry_to_article(entry, source.id)
-
-                    # Validate article data
-                    validate_article_data(article_data)
-
-                    # Check if article already exists
-                    existing_article = (
-                        db.query(Article)
-                        .filter_by(content_hash=article_data["content_hash"])
-                        .first()
-                    )
-
-                    if existing_article:
-                        result["skipped"] += 1
-                        continue
-
-                    # Create new article
-                    article = Article(**article_data)
-                    db.add(article)
-                    result["inserted"] += 1
-
-                except Exception as e:
-                    result["errors"] += 1
-                    logger.warning(
-                        "Failed to process article from file",
-                        extra={
-                            "error": str(e),
-                            "entry_title": getattr(entry, "title", "Unknown"),
-                        },
-                    )
-
-            # Commit all changes
             try:
+                _ensure_source_row(db, source, source_name, source_url)
+                for start in range(0, len(entries), VALUES_BATCH_SIZE):
+                    rows = _map_feed_entries(
+                        entries[start : start + VALUES_BATCH_SIZE],
+                        source.id,
+                        _ARTICLE_MAPPER,
+                        result,
+                    )
+                    inserted = _insert_new_articles(db, rows)
+                    result["inserted"] += inserted
+                    result["skipped"] += len(rows) - inserted
+                    hashes.extend(row["content_hash"] for row in rows)
+                _update_source_after_ingestion(db, source.id, True, None)
                 db.commit()
-                _update_source_after_ingestion(source, True, None)
+                _remember_hashes(hashes)
             except SQLAlchemyError as e:
                 db.rollback()
                 logger.error(
@@ -357,6 +570,12 @@ def ingest_feed_from_file(file_path: str) -> dict[str, int]:
                 )
                 result["errors"] += result["inserted"]
                 result["inserted"] = 0
+                # Update source error count in the same session
+                try:
+                    _update_source_after_ingestion(db, source.id, False, str(e))
+                    db.commit()
+                except SQLAlchemyError as update_error:
+                    _log_source_update_failure(update_error)
                 raise
 
     except Exception as e:
@@ -364,11 +583,6 @@ def ingest_feed_from_file(file_path: str) -> dict[str, int]:
         logger.error(
             "File ingestion failed", extra={"file_path": file_path, "error": str(e)}
         )
-        # Update source error count
-        from contextlib import suppress as _suppress
-
-        with _suppress(Exception):
-            _update_source_after_ingestion(source, False, str(e))
         # Debug mode to surface underlying error in CI/local runs
         import os as _os
 
@@ -406,6 +620,12 @@ Examples:
   # Ingest feed by source ID
   python -m app.ingestion.ingest_one --source-id 1
 
+  # Ingest all active sources concurrently
+  python -m app.ingestion.ingest_one --all-sources
+
+  # Ingest all active sources, one feed per worker and commit, 8 workers
+  python -m app.ingestion.ingest_one --parallel 8
+
   # Ingest from local file (for testing)
   python -m app.ingestion.ingest_one --file tests/fixtures/feeds/sample_feed.xml
         """,
@@ -429,6 +649,19 @@ Examples:
         "--source-id", type=int, metavar="ID", help="Ingest articles from source by ID"
     )
 
+    group.add_argument(
+        "--all-sources",
+        action="store_true",
+        help="Ingest articles from all active sources concurrently",
+    )
+
+    group.add_argument(
+        "--parallel",
+        type=int,
+        metavar="N",
+        help="Ingest all active sources with N workers, committing each feed",
+    )
+
     group.add_argument(
         "--file",
         type=str,
@@ -496,6 +729,41 @@ def _handle_source_id(args: argparse.Namespace) -> int:
     return 0
 
 
+def _active_feed_urls() -> list[str]:
+    """Feed URLs of all active sources, least recently fetched first."""
+    with db_session_mod.SessionLocal() as db:
+        return [
+            source.feed_url
+            for source in db.query(Source)
+            .filter_by(is_active=True)
+            .order_by(Source.last_fetched_at.asc().nulls_first())
+            .all()
+        ]
+
+
+def _ingest_active_feeds(feed_urls: list[str], parallel: int | None) -> dict[str, int]:
+    """Ingest with per-feed sessions when --parallel is set, else in bulk."""
+    if parallel:
+        return ingest_feeds_parallel(feed_urls, parallel)
+    return ingest_feeds_bulk(feed_urls)
+
+
+def _handle_all_sources(args: argparse.Namespace) -> int:
+    """Handle concurrent ingestion of all active sources."""
+    feed_urls = _active_feed_urls()
+    if not feed_urls:
+        logger.error("No active sources to ingest")
+        return 1
+
+    result = _ingest_active_feeds(feed_urls, args.parallel)
+    print(
+        f"Feed ingestion completed: {result['parsed']} parsed, "
+        f"{result['inserted']} inserted, {result['skipped']} skipped, "
+        f"{result['errors']} errors"
+    )
+    return 0
+
+
 def _handle_file_ingestion(args: argparse.Namespace) -> int:
     """Handle file ingestion."""
     if not Path(args.file).exists():
@@ -511,11 +779,24 @@ def _handle_file_ingestion(args: argparse.Namespace) -> int:
     return 0
 
 
-def main() -> int:
-    """Main CLI entry point."""
-    parser = create_argument_parser()
-    args = parser.parse_args()
+def _dispatch_command(args: argparse.Namespace) -> int:
+    """Run the handler for the selected mode; --parallel implies all sources."""
+    if args.seed_sources:
+        return _handle_seed_sources(args)
+    elif args.feed_url:
+        return _handle_feed_url(args)
+    elif args.source_id:
+        return _handle_source_id(args)
+    elif args.all_sources or args.parallel:
+        return _handle_all_sources(args)
+    elif args.file:
+        return _handle_file_ingestion(args)
+
+    return 0
+
 
+def _apply_cli_overrides(args: argparse.Namespace) -> None:
+    """Apply the verbosity and normalization flags; main restores the latter."""
     # Configure logging level
     if args.verbose:
         import logging
@@ -523,10 +804,6 @@ def main() -> int:
         logging.getLogger("app").setLevel(logging.DEBUG)
 
     # Handle normalization flag override
-    from app.core.config import settings
-
-    original_normalize_enabled = settings.normalize_enabled
-
     if args.no_normalize:
         settings.normalize_enabled = False
         logger.info("Content normalization disabled via CLI flag")
@@ -534,17 +811,17 @@ def main() -> int:
         settings.normalize_enabled = True
         logger.info("Content normalization enabled via CLI flag")
 
-    try:
-        if args.seed_sources:
-            return _handle_seed_sources(args)
-        elif args.feed_url:
-            return _handle_feed_url(args)
-        elif args.source_id:
-            return _handle_source_id(args)
-        elif args.file:
-            return _handle_file_ingestion(args)
 
-        return 0
+def main() -> int:
+    """Main CLI entry point."""
+    parser = create_argument_parser()
+    args = parser.parse_args()
+
+    original_normalize_enabled = settings.normalize_enabled
+    _apply_cli_overrides(args)
+
+    try:
+        return _dispatch_command(args)
 
     except KeyboardInterrupt:
         logger.info("Operation cancelled by user")
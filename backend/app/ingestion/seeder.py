@@ -1,13 +1,16 @@
 """Source seeding functionality for RSS feeds."""
 
-import json
 from typing import Any
 
-from pydantic import BaseModel, ValidationError
+import msgspec
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from sqlalchemy import literal_column, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.core.logging import get_logger
+from app.db.bulk import VALUES_BATCH_SIZE, bulk_insert
 from app.db.session import SessionLocal
 from app.models.source import Source
 
@@ -24,6 +27,10 @@ class SourceSeedModel(BaseModel):
     is_active: bool | None = True
 
 
+# Validates a whole seed list in one pydantic-core call
+_SOURCES_ADAPTER = TypeAdapter(list[SourceSeedModel])
+
+
 def seed_sources(sources_data: list[dict[str, Any]]) -> dict[str, int]:
     """
     Seed sources from list of dictionaries.
@@ -45,64 +52,20 @@ def seed_sources(sources_data: list[dict[str, Any]]) -> dict[str, int]:
         return result
 
     # Validate all sources first
-    validated_sources = []
-    for i, source_data in enumerate(sources_data):
-        try:
-            validated_source = SourceSeedModel(**source_data)
-            validated_sources.append(validated_source)
-        except ValidationError as e:
-            raise ValueError(f"Invalid source data at index {i}: {e}") from e
+    try:
+        validated_sources = _SOURCES_ADAPTER.validate_python(sources_data)
+    except ValidationError as e:
+        # The first location element is the offending item's list index
+        index = e.errors()[0]["loc"][0]
+        raise ValueError(f"Invalid source data at index {index}: {e}") from e
 
     # Process sources in database
     with SessionLocal() as db:
         try:
-            for validated_source in validated_sources:
-                # Check if source exists by feed_url (unique constraint)
-                existing_source = (
-                    db.query(Source)
-                    .filter_by(feed_url=validated_source.feed_url)
-                    .first()
-                )
-
-                if existing_source:
-                    # Update existing source
-                    existing_source.name = validated_source.name
-                    existing_source.url = validated_source.url
-                    existing_source.credibility_score = (
-                        validated_source.credibility_score or 0.5
-                    )
-                    existing_source.is_active = (
-                        validated_source.is_active
-                        if validated_source.is_active is not None
-                        else True
-                    )
-                    result["updated"] += 1
-                    logger.info(
-                        "Updated source",
-                        extra={
-                            "source_id": existing_source.id,
-                            "source_name": validated_source.name,
-                            "feed_url": validated_source.feed_url,
-                        },
-                    )
-                else:
-                    # Create new source
-                    new_source = Source(
-                        name=validated_source.name,
-                        url=validated_source.url,
-                        feed_url=validated_source.feed_url,
-                        credibility_score=validated_source.credibility_score,
-                        is_active=validated_source.is_active,
-                    )
-                    db.add(new_source)
-                    result["created"] += 1
-                    logger.info(
-                        "Created new source",
-                        extra={
-                            "source_name": validated_source.name,
-                            "feed_url": validated_source.feed_url,
-                        },
-                    )
+            if db.get_bind().dialect.name == "postgresql":
+                _upsert_sources(db, validated_sources, result)
+            else:
+                _insert_or_update_sources(db, validated_sources, result)
 
             # Commit all changes
             db.commit()
@@ -132,6 +95,168 @@ def seed_sources(sources_data: list[dict[str, Any]]) -> dict[str, int]:
     return result
 
 
+def _upsert_sources(
+    db: Session, validated_sources: list[SourceSeedModel], result: dict[str, int]
+) -> None:
+    """Seed with INSERT ... ON CONFLICT (feed_url) DO UPDATE (PostgreSQL)."""
+    # A statement may not touch the same row twice, so repeated feed_urls
+    # collapse to their last occurrence; the extra occurrences count as updates
+    rows_by_feed_url: dict[str, dict[str, Any]] = {}
+    for validated_source in validated_sources:
+        rows_by_feed_url[validated_source.feed_url] = {
+            "name": validated_source.name,
+            "url": validated_source.url,
+            "feed_url": validated_source.feed_url,
+            "credibility_score": (
+                validated_source.credibility_score
+                if validated_source.credibility_score is not None
+                else 0.5
+            ),
+            "is_active": (
+                validated_source.is_active
+                if validated_source.is_active is not None
+                else True
+            ),
+            "error_count": 0,
+        }
+    rows = list(rows_by_feed_url.values())
+
+    created = 0
+    for start in range(0, len(rows), VALUES_BATCH_SIZE):
+        stmt = pg_insert(Source).values(rows[start : start + VALUES_BATCH_SIZE])
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[Source.feed_url],
+            set_={
+                "name": stmt.excluded.name,
+                "url": stmt.excluded.url,
+                "credibility_score": stmt.excluded.credibility_score,
+                "is_active": stmt.excluded.is_active,
+            },
+        )
+        # xmax is 0 only on a freshly inserted row version
+        for source_id, name, feed_url, inserted in db.execute(
+            stmt.returning(
+                Source.id, Source.name, Source.feed_url, literal_column("xmax = 0")
+            )
+        ):
+            if inserted:
+                created += 1
+                logger.info(
+                    "Created new source",
+                    extra={"source_name": name, "feed_url": feed_url},
+                )
+            else:
+                logger.info(
+                    "Updated source",
+                    extra={
+                        "source_id": source_id,
+                        "source_name": name,
+                        "feed_url": feed_url,
+                    },
+                )
+
+    result["created"] += created
+    result["updated"] += len(validated_sources) - created
+
+
+def _insert_or_update_sources(
+    db: Session, validated_sources: list[SourceSeedModel], result: dict[str, int]
+) -> None:
+    """Seed with a feed_url prefetch, then bulk INSERT and bulk UPDATE."""
+    # One IN query per batch finds every source that already exists,
+    # instead of a SELECT per seeded row
+    feed_urls = list(dict.fromkeys(v.feed_url for v in validated_sources))
+    existing_ids: dict[str, int] = {}
+    for start in range(0, len(feed_urls), VALUES_BATCH_SIZE):
+        batch = feed_urls[start : start + VALUES_BATCH_SIZE]
+        for feed_url, existing_id in (
+            db.query(Source.feed_url, Source.id)
+            .filter(Source.feed_url.in_(batch))
+            .all()
+        ):
+            existing_ids[feed_url] = existing_id
+
+    # New rows are collected by feed_url and inserted in one batch; a
+    # feed_url repeated in the input updates its pending row instead
+    pending_inserts: dict[str, dict[str, Any]] = {}
+    # Existing rows are updated by primary key in one executemany;
+    # the last occurrence of a feed_url wins
+    pending_updates: dict[int, dict[str, Any]] = {}
+    for validated_source in validated_sources:
+        credibility_score = validated_source.credibility_score or 0.5
+        is_active = (
+            validated_source.is_active
+            if validated_source.is_active is not None
+            else True
+        )
+
+        pending = pending_inserts.get(validated_source.feed_url)
+        if pending is not None:
+            pending.update(
+                name=validated_source.name,
+                url=validated_source.url,
+                credibility_score=credibility_score,
+                is_active=is_active,
+            )
+            result["updated"] += 1
+            logger.info(
+                "Updated source",
+                extra={
+                    "source_name": validated_source.name,
+                    "feed_url": validated_source.feed_url,
+                },
+            )
+            continue
+
+        source_id = existing_ids.get(validated_source.feed_url)
+
+        if source_id is not None:
+            # Update existing source
+            pending_updates[source_id] = {
+                "id": source_id,
+                "name": validated_source.name,
+                "url": validated_source.url,
+                "credibility_score": credibility_score,
+                "is_active": is_active,
+            }
+            result["updated"] += 1
+            logger.info(
+                "Updated source",
+                extra={
+                    "source_id": source_id,
+                    "source_name": validated_source.name,
+                    "feed_url": validated_source.feed_url,
+                },
+            )
+        else:
+            # Create new source; every NOT NULL column is given
+            # explicitly since the COPY path applies no Python defaults
+            pending_inserts[validated_source.feed_url] = {
+                "name": validated_source.name,
+                "url": validated_source.url,
+                "feed_url": validated_source.feed_url,
+                "credibility_score": (
+                    validated_source.credibility_score
+                    if validated_source.credibility_score is not None
+                    else 0.5
+                ),
+                "is_active": is_active,
+                "error_count": 0,
+            }
+            result["created"] += 1
+            logger.info(
+                "Created new source",
+                extra={
+                    "source_name": validated_source.name,
+                    "feed_url": validated_source.feed_url,
+                },
+            )
+
+    bulk_insert(db, Source, list(pending_inserts.values()))
+    if pending_updates:
+        db.execute(update(Source), list(pending_updates.values()))
+
+
 def seed_sources_from_file(file_path: str) -> dict[str, int]:
     """
     Seed sources from JSON file.
@@ -148,11 +273,12 @@ def seed_sources_from_file(file_path: str) -> dict[str, int]:
         Exception: If database operation fails
     """
     try:
-        with open(file_path, encoding="utf-8") as f:
-            sources_data = json.load(f)
+        # msgspec decodes the raw UTF-8 bytes directly, without a str copy
+        with open(file_path, "rb") as f:
+            sources_data = msgspec.json.decode(f.read())
     except FileNotFoundError as e:
         raise FileNotFoundError(f"Source seed file not found: {file_path}") from e
-    except json.JSONDecodeError as e:
+    except msgspec.DecodeError as e:
         raise ValueError(f"Invalid JSON in source seed file: {e}") from e
 
     if not isinstance(sources_data, list):
@@ -223,50 +349,74 @@ def get_source_by_id(source_id: int, db: Session) -> Source | None:
     return db.query(Source).filter_by(id=source_id).first()
 
 
-def get_or_create_source(feed_url: str, name: str | None = None) -> Source:
+def get_or_create_source(
+    feed_url: str, name: str | None = None, db: Session | None = None
+) -> Source:
     """
     Get existing source or create inactive placeholder.
 
     Args:
         feed_url: Feed URL to search for or create
         name: Optional name for new source
+        db: Session to work in; a new placeholder is then only flushed and
+            commits with the caller's transaction. Without one, a session of
+            its own is opened and committed
 
     Returns:
         Source instance (existing or newly created)
     """
-    with SessionLocal() as db:
-        # Try to find existing source
-        existing_source = get_source_by_feed_url(feed_url, db)
-        if existing_source:
-            return existing_source
-
-        # Create inactive placeholder
-        placeholder_name = name or f"Unknown Source ({feed_url})"
-        new_source = Source(
-            name=placeholder_name,
-            url=feed_url,  # Use feed_url as fallback for url
-            feed_url=feed_url,
-            credibility_score=0.5,
-            is_active=False,  # Inactive until properly configured
-        )
+    if db is not None:
+        source, _ = _get_or_create_source(db, feed_url, name)
+        return source
+
+    with SessionLocal() as own_db:
+        source, created = _get_or_create_source(own_db, feed_url, name)
+        if created:
+            try:
+                own_db.commit()
+                own_db.refresh(source)
+            except SQLAlchemyError as e:
+                own_db.rollback()
+                logger.error(
+                    "Failed to create placeholder source", extra={"error": str(e)}
+                )
+                raise
+        return source
 
-        try:
-            db.add(new_source)
-            db.commit()
-            db.refresh(new_source)
 
-            logger.info(
-                "Created placeholder source",
-                extra={
-                    "source_id": new_source.id,
-                    "name": placeholder_name,
-                    "feed_url": feed_url,
-                },
-            )
+def _get_or_create_source(
+    db: Session, feed_url: str, name: str | None
+) -> tuple[Source, bool]:
+    """Look up feed_url's source, flushing a placeholder if there is none.
 
-            return new_source
+    Returns:
+        The source and whether it was just created
+    """
+    # Try to find existing source
+    existing_source = get_source_by_feed_url(feed_url, db)
+    if existing_source:
+        return existing_source, False
+
+    # Create inactive placeholder
+    placeholder_name = name or f"Unknown Source ({feed_url})"
+    new_source = Source(
+        name=placeholder_name,
+        url=feed_url,  # Use feed_url as fallback for url
+        feed_url=feed_url,
+        credibility_score=0.5,
+        is_active=False,  # Inactive until properly configured
+    )
 
-        except SQLAlchemyError as e:
-            db.rollback()
-            logger.error("Failed to create placeholder source", extra={"error": str(e)})
-            raise
+    db.add(new_source)
+    db.flush()
+
+    logger.info(
+        "Created placeholder source",
+        extra={
+            "source_id": new_source.id,
+            "source_name": placeholder_name,
+            "feed_url": feed_url,
+        },
+    )
+
+    return new_source, True
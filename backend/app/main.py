@@ -4,8 +4,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.api.health import router as health_router
+from app.api.health_interceptor import HealthCheckInterceptor
 from app.core.config import settings
 from app.core.logging import get_logger, setup_logging
+from app.core.responses import MsgspecJSONResponse
 from app.middleware.error_handler import setup_error_handling
 
 # Setup logging as early as possible
@@ -21,6 +23,7 @@ def create_app() -> FastAPI:
         version=settings.version,
         docs_url="/docs",
         redoc_url="/redoc",
+        default_response_class=MsgspecJSONResponse,
     )
 
     # Setup error handling and logging middleware
@@ -44,7 +47,11 @@ def create_app() -> FastAPI:
     return app
 
 
-app = create_app()
+# FastAPI instance, kept for tests and dependency overrides
+fastapi_app = create_app()
+
+# ASGI entrypoint: liveness probes are answered before the FastAPI stack
+app = HealthCheckInterceptor(fastapi_app)
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -1,56 +1,74 @@
 from __future__ import annotations
 
+import logging
 import time
-from collections.abc import Awaitable, Callable
 
-from fastapi import FastAPI, Request, Response
+import msgspec
+from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
-from pydantic import BaseModel
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from app.core.logging import get_logger, get_request_id, set_request_id
+from app.core.responses import MsgspecJSONResponse
 
 logger = get_logger(__name__)
 
 
-class ErrorResponse(BaseModel):
-    """Standard error response format."""
+class ErrorResponse(msgspec.Struct):
+    """Standard error response format, encoded directly by msgspec."""
 
     error: dict[str, str]
 
 
-async def logging_middleware(
-    request: Request, call_next: Callable[[Request], Awaitable[Response]]
-) -> Response:
-    """Middleware for request logging and timing."""
-    # Set request ID for correlation
-    request_id = set_request_id()
+class LoggingMiddleware:
+    """ASGI middleware for request logging and timing.
 
-    # Log request start
-    start_time = time.time()
-    logger.info(
-        f"{request.method} {request.url.path}",
-        extra={
-            "endpoint": f"{request.method} {request.url.path}",
-            "request_id": request_id,
-        },
-    )
+    Written against raw ASGI rather than BaseHTTPMiddleware, so requests are
+    not re-wrapped in an extra task and a streamed response body.
+    """
 
-    # Process request
-    response = await call_next(request)
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
 
-    # Log response
-    duration_ms = round((time.time() - start_time) * 1000, 2)
-    logger.info(
-        f"{request.method} {request.url.path} completed",
-        extra={
-            "endpoint": f"{request.method} {request.url.path}",
-            "status_code": response.status_code,
-            "duration_ms": duration_ms,
-            "request_id": request_id,
-        },
-    )
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        # Set request ID for correlation
+        request_id = set_request_id()
+        endpoint = f"{scope['method']} {scope['path']}"
+
+        # Log request start
+        start_ns = time.perf_counter_ns()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                endpoint, extra={"endpoint": endpoint, "request_id": request_id}
+            )
 
-    return response
+        status_code = 500
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        # Process request
+        await self.app(scope, receive, send_wrapper)
+
+        # Log response
+        if logger.isEnabledFor(logging.INFO):
+            duration_ms = round((time.perf_counter_ns() - start_ns) / 1_000_000, 2)
+            logger.info(
+                f"{endpoint} completed",
+                extra={
+                    "endpoint": endpoint,
+                    "status_code": status_code,
+                    "duration_ms": duration_ms,
+                    "request_id": request_id,
+                },
+            )
 
 
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
@@ -76,16 +94,13 @@ async def global_exception_handler(request: Request, exc: Exception) -> JSONResp
         }
     )
 
-    return JSONResponse(
-        status_code=500,
-        content=error_response.model_dump(),
-    )
+    return MsgspecJSONResponse(status_code=500, content=error_response)
 
 
 def setup_error_handling(app: FastAPI) -> None:
     """Configure error handling for the FastAPI application."""
     # Add logging middleware
-    app.middleware("http")(logging_middleware)
+    app.add_middleware(LoggingMiddleware)
 
     # Add global exception handler
     app.exception_handler(Exception)(global_exception_handler)
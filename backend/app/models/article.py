@@ -5,6 +5,7 @@ from sqlalchemy import JSON, DateTime, ForeignKey, Index, Integer, String, Text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
+from app.db.types import HexDigest
 
 if TYPE_CHECKING:
     from .article_summary import ArticleSummary
@@ -21,7 +22,8 @@ class Article(Base):
     title: Mapped[str] = mapped_column(String(512), nullable=False)
     link: Mapped[str] = mapped_column(String(1024), nullable=False)
     summary_raw: Mapped[str | None] = mapped_column(Text, nullable=True)
-    content_hash: Mapped[str] = mapped_column(String(64), unique=True, nullable=False)
+    # SHA-256 stored as 32 raw bytes (bytea), read back as a 64-char hex str
+    content_hash: Mapped[str] = mapped_column(HexDigest(32), nullable=False)
     published_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     author: Mapped[str | None] = mapped_column(String(255), nullable=True)
     tags: Mapped[list[str]] = mapped_column(JSON, default=list, nullable=False)
@@ -30,7 +32,8 @@ class Article(Base):
     __table_args__ = (
         Index("idx_published_at", "published_at"),
         Index("idx_source_published", "source_id", "published_at"),
-        Index("idx_content_hash", "content_hash"),
+        # Dedup key: ingestion inserts with ON CONFLICT (content_hash) DO NOTHING
+        Index("ix_articles_content_hash", "content_hash", unique=True),
     )
 
     # Relationships
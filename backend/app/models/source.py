@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import TYPE_CHECKING
 
-from sqlalchemy import Boolean, DateTime, Float, Integer, String
+from sqlalchemy import Boolean, DateTime, Float, Index, Integer, String, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -18,11 +18,21 @@ class Source(Base):
     feed_url: Mapped[str] = mapped_column(String(512), unique=True, nullable=False)
     credibility_score: Mapped[float] = mapped_column(Float, default=0.5, nullable=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True, nullable=False)
-    last_fetched_at: Mapped[datetime | None] = mapped_column(
-        DateTime, nullable=True, index=True
-    )
+    last_fetched_at: Mapped[datetime | None] = mapped_column(DateTime, nullable=True)
     last_error: Mapped[str | None] = mapped_column(String(1024), nullable=True)
     error_count: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
 
+    __table_args__ = (
+        # Serves "active sources, least recently fetched first" without a sort;
+        # partial, so inactive sources never enter it. The only index on
+        # last_fetched_at, so fetch stamps maintain one index, not two
+        Index(
+            "idx_sources_active_last_fetched",
+            "last_fetched_at",
+            postgresql_where=text("is_active = true"),
+            sqlite_where=text("is_active = 1"),
+        ),
+    )
+
     # Relationships
     articles: Mapped[list["Article"]] = relationship("Article", back_populates="source")
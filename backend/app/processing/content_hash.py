@@ -1,6 +1,7 @@
 """Stable content hash generation for deduplication."""
 
 import hashlib
+import logging
 from datetime import datetime
 from typing import Any
 
@@ -15,6 +16,11 @@ from app.processing.normalization import (
 logger = get_logger(__name__)
 
 
+def _link_fallback_hash(link_bytes: bytes) -> str:
+    """First 8 hex chars of the link's SHA256, for entries without a date."""
+    return hashlib.sha256(link_bytes).hexdigest()[:8]
+
+
 def compute_content_hash(
     title: str | None,
     link: str | None,
@@ -44,8 +50,9 @@ def compute_content_hash(
     # Normalize title for hashing (lowercase, cleaned)
     normalized_title = normalize_title_for_hash(title)
 
-    # Canonicalize link
+    # Canonicalize link; encoded once for both the fallback and the final hash
     canonical_link = canonicalize_url(link) if link else ""
+    link_bytes = canonical_link.encode("utf-8")
 
     # Handle published timestamp
     if published_at:
@@ -66,13 +73,9 @@ def compute_content_hash(
                 "Failed to format published_at for hash, using fallback",
                 extra={"published_at": str(published_at), "error": str(e)},
             )
-            # Generate fallback hash from link
-            link_hash = hashlib.sha256(canonical_link.encode("utf-8")).hexdigest()[:8]
-            timestamp_part = f"fallback:{link_hash}"
+            timestamp_part = f"fallback:{_link_fallback_hash(link_bytes)}"
     else:
-        # Generate fallback hash from link
-        link_hash = hashlib.sha256(canonical_link.encode("utf-8")).hexdigest()[:8]
-        timestamp_part = f"fallback:{link_hash}"
+        timestamp_part = f"fallback:{_link_fallback_hash(link_bytes)}"
 
     # Handle summary (first N characters of cleaned summary)
     summary_part = ""
@@ -81,28 +84,39 @@ def compute_content_hash(
         if normalized_summary:
             summary_part = normalized_summary[: settings.hash_summary_prefix_len]
 
-    # Combine all parts
-    hash_input = f"{normalized_title}|{canonical_link}|{timestamp_part}|{summary_part}"
+    # Combine the encoded parts as bytes; equals the UTF-8 encoding of
+    # f"{title}|{link}|{timestamp}|{summary}" without building that str
+    hash_input = b"|".join(
+        (
+            normalized_title.encode("utf-8"),
+            link_bytes,
+            timestamp_part.encode("utf-8"),
+            summary_part.encode("utf-8"),
+        )
+    )
 
     # Generate SHA256 hash
-    content_hash = hashlib.sha256(hash_input.encode("utf-8")).hexdigest()
-
-    logger.debug(
-        "Generated content hash",
-        extra={
-            "title_preview": (
-                normalized_title[:30] + "..."
-                if len(normalized_title) > 30
-                else normalized_title
-            ),
-            "link": canonical_link,
-            "timestamp_part": timestamp_part,
-            "summary_preview": (
-                summary_part[:30] + "..." if len(summary_part) > 30 else summary_part
-            ),
-            "hash_preview": content_hash[:16] + "...",
-        },
-    )
+    content_hash = hashlib.sha256(hash_input).hexdigest()
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Generated content hash",
+            extra={
+                "title_preview": (
+                    normalized_title[:30] + "..."
+                    if len(normalized_title) > 30
+                    else normalized_title
+                ),
+                "link": canonical_link,
+                "timestamp_part": timestamp_part,
+                "summary_preview": (
+                    summary_part[:30] + "..."
+                    if len(summary_part) > 30
+                    else summary_part
+                ),
+                "hash_preview": content_hash[:16] + "...",
+            },
+        )
 
     return content_hash
 
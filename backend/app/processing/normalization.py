@@ -1,7 +1,11 @@
 """Content normalization functionality."""
 
+import logging
 import re
+from collections.abc import Callable
 from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from functools import partial
 from typing import Any
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
 
@@ -276,6 +280,35 @@ def normalize_tags(tags: list[str] | None) -> list[str]:
     return sorted(normalized_tags)
 
 
+def parse_date_string(date_str: str) -> datetime:
+    """
+    Parse a feed date, trying the two formats feeds nearly always use first.
+
+    ISO 8601 (Atom, dc:date) goes through datetime.fromisoformat and RFC 822
+    (RSS pubDate) through email.utils; only other strings pay for dateutil,
+    which handles many formats.
+
+    Args:
+        date_str: Stripped, non-empty date string
+
+    Returns:
+        Parsed datetime; naive if the string carries no timezone
+
+    Raises:
+        ValueError: If no parser accepts the string
+    """
+    try:
+        return datetime.fromisoformat(date_str)
+    except ValueError:
+        pass
+    try:
+        return parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        pass
+    parsed_date: datetime = date_parser.parse(date_str)
+    return parsed_date
+
+
 def normalize_published_date(date_str: str | None) -> datetime:
     """
     Normalize published date to timezone-aware UTC datetime.
@@ -293,8 +326,7 @@ def normalize_published_date(date_str: str | None) -> datetime:
         return fallback
 
     try:
-        # Parse with dateutil which handles many formats
-        parsed_date = date_parser.parse(date_str.strip())
+        parsed_date = parse_date_string(date_str.strip())
 
         # Ensure timezone awareness
         if parsed_date.tzinfo is None:
@@ -315,6 +347,26 @@ def normalize_published_date(date_str: str | None) -> datetime:
         return datetime.now(UTC).replace(hour=0, minute=0, second=0, microsecond=0)
 
 
+def entry_field_getter(entry: Any) -> Callable[[str, Any], Any]:
+    """
+    Return a ``(name, default)`` lookup for an entry's top-level fields.
+
+    feedparser entries are dicts, so their fields are read with one
+    ``dict.get`` call each instead of going through ``__getattr__``, which
+    FeedParserDict only reaches after the normal attribute lookup misses.
+    Any other object falls back to ``getattr``.
+
+    Args:
+        entry: RSS feed entry object
+
+    Returns:
+        Callable taking a field name and a default
+    """
+    if isinstance(entry, dict):
+        return entry.get
+    return partial(getattr, entry)
+
+
 def normalize_entry(entry: Any) -> dict[str, Any]:
     """
     Normalize a complete RSS entry with all fields.
@@ -325,22 +377,24 @@ def normalize_entry(entry: Any) -> dict[str, Any]:
     Returns:
         Dictionary with normalized fields
     """
+    get = entry_field_getter(entry)
+
     # Extract and normalize basic fields
-    title = getattr(entry, "title", "")
-    link = getattr(entry, "link", "")
-    summary = getattr(entry, "summary", None) or getattr(entry, "description", None)
-    author = getattr(entry, "author", None)
+    title = get("title", "")
+    link = get("link", "")
+    summary = get("summary", None) or get("description", None)
+    author = get("author", None)
 
     # Extract tags
     raw_tags = []
-    entry_tags = getattr(entry, "tags", [])
+    entry_tags = get("tags", [])
     for tag in entry_tags:
         tag_term = getattr(tag, "term", "")
         if tag_term:
             raw_tags.append(tag_term)
 
     # Extract published date
-    published_str = getattr(entry, "published", None) or getattr(entry, "updated", None)
+    published_str = get("published", None) or get("updated", None)
 
     # Normalize all fields
     normalized = {
@@ -353,18 +407,19 @@ def normalize_entry(entry: Any) -> dict[str, Any]:
         "published_at": normalize_published_date(published_str),
     }
 
-    logger.debug(
-        "Normalized entry",
-        extra={
-            "original_title": title[:50] + "..." if len(title) > 50 else title,
-            "normalized_title": (
-                str(normalized["title"])[:50] + "..."
-                if len(str(normalized["title"])) > 50
-                else str(normalized["title"])
-            ),
-            "original_link": link,
-            "canonical_link": normalized["link"],
-        },
-    )
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug(
+            "Normalized entry",
+            extra={
+                "original_title": title[:50] + "..." if len(title) > 50 else title,
+                "normalized_title": (
+                    str(normalized["title"])[:50] + "..."
+                    if len(str(normalized["title"])) > 50
+                    else str(normalized["title"])
+                ),
+                "original_link": link,
+                "canonical_link": normalized["link"],
+            },
+        )
 
     return normalized
@@ -1,8 +1,10 @@
 import os
 import sqlite3
 import sys
+from collections.abc import Generator
 from typing import Any
 
+import pytest
 from sqlalchemy import event
 from sqlalchemy.engine import Engine
 
@@ -23,3 +25,52 @@ def _set_sqlite_pragma(
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
+
+
+@pytest.fixture(scope="session")
+def _test_schema() -> Generator[Engine, None, None]:
+    """Create the schema on the app's test engine once for the whole run."""
+    # Imported lazily: session.py picks the test database from
+    # PYTEST_CURRENT_TEST, which is only set once a test is running
+    import app.models  # noqa: F401  (registers every table on Base.metadata)
+    from app.db.base import Base
+    from app.db.session import get_engine
+
+    engine = get_engine()
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(autouse=True)
+def _rollback_app_sessions(_test_schema: Engine) -> Generator[None, None, None]:
+    """Run each test inside one outer transaction that is rolled back.
+
+    SessionLocal is bound to the test connection with
+    join_transaction_mode="create_savepoint", so code under test that commits
+    or rolls back only touches a SAVEPOINT and nothing outlives the test.
+    """
+    from app.db.session import SessionLocal
+
+    engine = _test_schema
+    connection = engine.connect()
+    transaction = connection.begin()
+    SessionLocal.configure(bind=connection, join_transaction_mode="create_savepoint")
+    try:
+        yield
+    finally:
+        SessionLocal.configure(
+            bind=engine, join_transaction_mode="conservative_savepoint"
+        )
+        transaction.rollback()
+        connection.close()
+
+
+@pytest.fixture(autouse=True)
+def _forget_seen_hashes() -> Generator[None, None, None]:
+    """Clear ingestion's seen-hash cache, which would outlive the rollback."""
+    from app.ingestion.ingest_one import _SEEN_HASHES
+
+    _SEEN_HASHES.clear()
+    yield
+    _SEEN_HASHES.clear()
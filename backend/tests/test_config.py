@@ -43,3 +43,27 @@ def test_get_settings_singleton() -> None:
     assert isinstance(settings1, Settings)
     assert isinstance(settings2, Settings)
     assert settings1.app_name == settings2.app_name
+
+
+def test_database_url_resolved_from_parts() -> None:
+    """Test that the DSN is assembled from POSTGRES_* when DATABASE_URL is unset."""
+    env = {
+        "POSTGRES_USER": "u",
+        "POSTGRES_PASSWORD": "p",
+        "POSTGRES_HOST": "db",
+        "POSTGRES_PORT": "6432",
+        "POSTGRES_DB": "news",
+    }
+    with patch.dict(os.environ, env):
+        os.environ.pop("DATABASE_URL", None)
+        settings = Settings(_env_file=None)
+
+        assert settings.database_url_resolved == "postgresql://u:p@db:6432/news"
+
+
+def test_database_url_resolved_prefers_database_url() -> None:
+    """Test that an explicit DATABASE_URL wins over the POSTGRES_* parts."""
+    with patch.dict(os.environ, {"DATABASE_URL": "postgresql://x:y@h:1/d"}):
+        settings = Settings(_env_file=None)
+
+        assert settings.database_url_resolved == "postgresql://x:y@h:1/d"
@@ -1,6 +1,7 @@
 import hashlib
 from collections.abc import Generator
 from datetime import datetime
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from sqlalchemy import create_engine, text
@@ -20,8 +21,7 @@ from app.models.user import User
 def db_engine() -> Generator[Engine, None, None]:
     """Create test database engine"""
     # Use test database URL if available, otherwise use main database URL
-    database_url = settings.test_database_url or settings.database_url
-    assert database_url is not None
+    database_url = settings.test_database_url or settings.database_url_resolved
     engine = create_engine(database_url, echo=False, future=True)
 
     # Create all tables
@@ -102,6 +102,17 @@ def test_source_creation(db_session: Session) -> None:
     assert source.error_count == 0
 
 
+def test_updates_refresh_updated_at() -> None:
+    """Test that UPDATEs set updated_at without relying on a trigger"""
+    from sqlalchemy import update
+    from sqlalchemy.dialects import sqlite
+
+    stmt = update(User).where(User.id == 1).values(email="new@example.com")
+    compiled = str(stmt.compile(dialect=sqlite.dialect()))
+
+    assert "updated_at=CURRENT_TIMESTAMP" in compiled
+
+
 def test_article_creation(db_session: Session) -> None:
     """Test creating an article"""
     source = Source(
@@ -166,6 +177,205 @@ def test_article_deduplication(db_session: Session) -> None:
         db_session.commit()
 
 
+@pytest.mark.parametrize("count", [3, 150])
+def test_bulk_insert_articles(db_session: Session, count: int) -> None:
+    """Test bulk article insert; 150 rows take the COPY path on PostgreSQL"""
+    from app.db.bulk import bulk_insert
+
+    source = Source(
+        name="TechCrunch",
+        url="https://techcrunch.com",
+        feed_url="https://techcrunch.com/feed",
+    )
+    db_session.add(source)
+    db_session.commit()
+
+    rows = [
+        {
+            "source_id": source.id,
+            "title": f"Bulk\tArticle {i}",
+            "link": f"https://example.com/bulk/{i}",
+            "summary_raw": None,
+            "content_hash": hashlib.sha256(f"bulk_{i}".encode()).hexdigest(),
+            "published_at": datetime.utcnow(),
+            "author": "",
+            "tags": ["tech", "news"],
+        }
+        for i in range(count)
+    ]
+    assert bulk_insert(db_session, Article, rows) == count
+
+    articles = db_session.query(Article).filter_by(source_id=source.id).all()
+    assert len(articles) == count
+    first = next(a for a in articles if a.link.endswith("/0"))
+    assert first.title == "Bulk\tArticle 0"
+    assert first.content_hash == rows[0]["content_hash"]
+    assert first.summary_raw is None
+    assert first.author == ""
+    assert first.tags == ["tech", "news"]
+
+
+def test_bulk_insert_ignores_conflicting_articles(db_session: Session) -> None:
+    """Test that bulk insert skips rows whose content hash already exists"""
+    from app.db.bulk import bulk_insert
+
+    source = Source(
+        name="TechCrunch",
+        url="https://techcrunch.com",
+        feed_url="https://techcrunch.com/feed",
+    )
+    db_session.add(source)
+    db_session.commit()
+
+    def row(key: str) -> dict[str, object]:
+        return {
+            "source_id": source.id,
+            "title": f"Article {key}",
+            "link": f"https://example.com/{key}",
+            "content_hash": hashlib.sha256(key.encode()).hexdigest(),
+            "published_at": datetime.utcnow(),
+            "tags": [],
+        }
+
+    assert bulk_insert(db_session, Article, [row("a")]) == 1
+    inserted = bulk_insert(
+        db_session, Article, [row("a"), row("b")], ignore_conflicts_on=["content_hash"]
+    )
+
+    assert inserted == 1
+    assert db_session.query(Article).filter_by(source_id=source.id).count() == 2
+
+    # Batched statements add up their counts, conflicts included
+    with patch("app.db.bulk.VALUES_BATCH_SIZE", 2):
+        inserted = bulk_insert(
+            db_session,
+            Article,
+            [row(key) for key in ("a", "c", "d", "b", "e")],
+            ignore_conflicts_on=["content_hash"],
+        )
+
+    assert inserted == 3
+    assert db_session.query(Article).filter_by(source_id=source.id).count() == 5
+
+    # The dialect's bind parameter limit also caps rows per statement
+    with patch.dict("app.db.bulk._MAX_BIND_PARAMS", {"sqlite": 2 * len(row("f"))}):
+        inserted = bulk_insert(
+            db_session,
+            Article,
+            [row(key) for key in ("f", "g", "a", "h", "i")],
+            ignore_conflicts_on=["content_hash"],
+        )
+
+    assert inserted == 4
+    assert db_session.query(Article).filter_by(source_id=source.id).count() == 9
+
+
+def test_bulk_copy_serializes_rows_to_copy_text() -> None:
+    """Test COPY text encoding of NULLs, escapes, bytes, datetimes and JSON"""
+    from sqlalchemy import Table
+    from sqlalchemy.dialects import postgresql
+
+    from app.db.bulk import bulk_copy
+
+    session = MagicMock()
+    session.get_bind.return_value.dialect = postgresql.dialect()
+    connection = session.connection.return_value.connection
+    cursor = connection.cursor.return_value
+    copied: dict[str, str] = {}
+    cursor.copy_expert.side_effect = lambda statement, buffer: copied.update(
+        statement=statement, data=buffer.read()
+    )
+
+    table = Article.__table__
+    assert isinstance(table, Table)
+    content_hash = hashlib.sha256(b"copy").hexdigest()
+    columns = ["title", "summary_raw", "content_hash", "published_at", "tags"]
+    bulk_copy(
+        session,
+        table,
+        columns,
+        [
+            {
+                "title": "Tab\there\\ and\nnewline",
+                "summary_raw": None,
+                "content_hash": content_hash,
+                "published_at": datetime(2025, 1, 2, 3, 4, 5),
+                "tags": ["tech", "news"],
+            }
+        ],
+    )
+
+    assert copied["statement"] == (
+        "COPY articles (title, summary_raw, content_hash, published_at, tags) "
+        "FROM STDIN"
+    )
+    assert copied["data"] == (
+        "Tab\\there\\\\ and\\nnewline\t\\N\t"
+        # bytea's \x prefix is itself backslash-escaped in COPY text
+        f"\\\\x{content_hash}\t2025-01-02T03:04:05\t"
+        '["tech", "news"]\n'
+    )
+    cursor.close.assert_called_once()
+
+
+def test_copy_value_encodes_booleans() -> None:
+    """Test that booleans use PostgreSQL's t/f COPY literals"""
+    from sqlalchemy import Boolean
+    from sqlalchemy.dialects import postgresql
+
+    from app.db.bulk import _copy_value
+
+    dialect = postgresql.dialect()
+    assert _copy_value(True, Boolean(), dialect) == "t"
+    assert _copy_value(False, Boolean(), dialect) == "f"
+
+
+def test_bulk_insert_copies_through_staging_table_on_conflict() -> None:
+    """Test the COPY path with ignore_conflicts_on stages rows in a temp table"""
+    from sqlalchemy.dialects import postgresql
+
+    from app.db.bulk import COPY_THRESHOLD, bulk_insert
+
+    session = MagicMock()
+    session.get_bind.return_value.dialect = postgresql.dialect()
+    session.execute.return_value.rowcount = 7
+    connection = session.connection.return_value.connection
+    cursor = connection.cursor.return_value
+
+    rows = [
+        {"title": f"Article {i}", "content_hash": hashlib.sha256(b"%d" % i).hexdigest()}
+        for i in range(COPY_THRESHOLD)
+    ]
+    inserted = bulk_insert(session, Article, rows, ignore_conflicts_on=["content_hash"])
+
+    assert inserted == 7
+    statements = [str(c.args[0]) for c in session.execute.call_args_list]
+    assert statements[0].startswith("CREATE TEMP TABLE _staging_articles ")
+    assert statements[1] == (
+        "INSERT INTO articles (title, content_hash) "
+        "SELECT title, content_hash FROM _staging_articles "
+        "ON CONFLICT (content_hash) DO NOTHING"
+    )
+    assert statements[2] == "DROP TABLE _staging_articles"
+    cursor.copy_expert.assert_called_once()
+    assert cursor.copy_expert.call_args.args[0] == (
+        "COPY _staging_articles (title, content_hash) FROM STDIN"
+    )
+
+
+def test_bulk_insert_rejects_conflict_handling_on_other_dialects() -> None:
+    """Test that ignore_conflicts_on fails clearly where ON CONFLICT is missing"""
+    from app.db.bulk import bulk_insert
+
+    session = Mock()
+    session.get_bind.return_value.dialect.name = "mysql"
+
+    with pytest.raises(ValueError, match="not supported for dialect 'mysql'"):
+        bulk_insert(
+            session, Article, [{"title": "A"}], ignore_conflicts_on=["content_hash"]
+        )
+
+
 def test_unique_email_constraint(db_session: Session) -> None:
     """Test that user emails must be unique"""
     user1 = User(email="test@example.com", is_active=True)
@@ -1,5 +1,10 @@
+import asyncio
+from unittest.mock import AsyncMock, patch
+
 from fastapi.testclient import TestClient
 
+from app.api import health
+from app.core.config import settings
 from app.main import app
 
 client = TestClient(app)
@@ -73,3 +78,75 @@ def test_health_endpoint_methods() -> None:
         # POST should not be allowed
         response = client.post(endpoint)
         assert response.status_code == 405
+
+
+def test_health_endpoint_served_before_fastapi() -> None:
+    """Test that /healthz is answered by the ASGI interceptor, not a route."""
+    from app.main import fastapi_app
+
+    paths = {getattr(route, "path", None) for route in fastapi_app.routes}
+    assert "/healthz" not in paths
+
+    response = client.post("/healthz")
+    assert response.status_code == 405
+    assert response.headers["allow"] == "GET"
+
+
+def test_readiness_database_probe_is_cached() -> None:
+    """Test that the opt-in DB readiness probe is cached between requests."""
+    probe = AsyncMock(return_value=False)
+
+    with (
+        patch.object(settings, "readiness_check_database", True),
+        patch.object(health, "_last_check", (float("-inf"), True)),
+        patch.object(health, "_probe_database", probe),
+    ):
+        first = client.get("/readyz")
+        second = client.get("/readyz")
+
+    assert first.status_code == 503
+    assert first.json() == {"status": "not_ready"}
+    assert second.status_code == 503
+    probe.assert_awaited_once()
+
+
+def test_readiness_database_probe_times_out() -> None:
+    """Test that a hung database probe reports not ready instead of hanging."""
+
+    async def hang() -> None:
+        await asyncio.sleep(10)
+
+    with (
+        patch.object(settings, "readiness_check_database", True),
+        patch.object(settings, "readiness_probe_timeout_sec", 0.01),
+        patch.object(health, "_last_check", (float("-inf"), True)),
+        patch.object(health, "_run_probe", hang),
+    ):
+        response = client.get("/readyz")
+
+    assert response.status_code == 503
+    assert response.json() == {"status": "not_ready"}
+
+
+def test_readiness_database_probe_is_single_flight() -> None:
+    """Test that concurrent requests after the TTL share one database probe."""
+    calls = 0
+
+    async def slow_probe() -> bool:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return True
+
+    async def check_concurrently() -> list[bool]:
+        return list(await asyncio.gather(*(health._database_ready() for _ in range(5))))
+
+    with (
+        patch.object(health, "_last_check", (float("-inf"), True)),
+        patch.object(health, "_probe_lock", asyncio.Lock()),
+        patch.object(health, "_probe_database", slow_probe),
+    ):
+        results = asyncio.run(check_concurrently())
+
+    assert results == [True] * 5
+    assert calls == 1
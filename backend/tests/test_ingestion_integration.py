@@ -131,6 +131,30 @@ class TestFeedIngestionIntegration:
             assert result2["inserted"] == 0
             assert result2["skipped"] >= 10
 
+    def test_reingest_skips_seen_hashes_without_querying(self):
+        """Test that hashes committed by this process skip validation and insert."""
+        from app.ingestion import ingest_one
+        from app.ingestion.ingest_one import ingest_feed_from_file
+
+        feed_file = Path(__file__).parent / "fixtures" / "feeds" / "sample_feed.xml"
+
+        with patch("app.ingestion.ingest_one.get_or_create_source") as mock_source:
+            mock_source.return_value = Mock(id=1, name="Test Source")
+
+            result1 = ingest_feed_from_file(str(feed_file))
+            assert len(ingest_one._SEEN_HASHES) == result1["inserted"]
+
+            with (
+                patch("app.ingestion.ingest_one.bulk_insert") as mock_insert,
+                patch("app.ingestion.mapper.validate_article_data") as mock_valid,
+            ):
+                result2 = ingest_feed_from_file(str(feed_file))
+
+            mock_insert.assert_not_called()
+            mock_valid.assert_not_called()
+            assert result2["inserted"] == 0
+            assert result2["skipped"] == result1["inserted"]
+
     def test_ingest_with_malicious_content(self):
         """Test ingestion sanitizes malicious content."""
         from app.db.session import SessionLocal
@@ -182,6 +206,142 @@ class TestFeedIngestionIntegration:
             assert source.last_fetched_at is not None
             assert source.error_count == 0  # No errors expected
 
+    def test_ingest_feeds_bulk_fetches_all_and_inserts_once(self):
+        """Test concurrent multi-feed ingestion with a failing feed."""
+        import feedparser
+
+        from app.db.session import SessionLocal
+        from app.ingestion.ingest_one import ingest_feeds_bulk
+        from app.models.source import Source
+
+        feed_file = Path(__file__).parent / "fixtures" / "feeds" / "sample_feed.xml"
+        parsed = feedparser.parse(feed_file.read_bytes())
+        good_url = "https://example.com/good.xml"
+        bad_url = "https://example.com/bad.xml"
+
+        def fake_fetch(url):
+            if url == bad_url:
+                raise Exception("Network error")
+            return parsed
+
+        with patch(
+            "app.ingestion.feed_client.FeedClient.fetch_feed", side_effect=fake_fetch
+        ):
+            result = ingest_feeds_bulk([good_url, bad_url])
+
+        assert result["parsed"] == len(parsed.entries)
+        assert result["inserted"] >= 10
+        assert result["errors"] == 1
+
+        with SessionLocal() as db:
+            good = db.query(Source).filter_by(feed_url=good_url).one()
+            bad = db.query(Source).filter_by(feed_url=bad_url).one()
+            assert good.last_fetched_at is not None
+            assert bad.error_count == 1
+
+    def test_ingest_feed_from_url_records_fetch_failure_for_new_feed(self):
+        """Test a failed fetch of an unknown feed is recorded on its placeholder."""
+        from app.db.session import SessionLocal
+        from app.ingestion.ingest_one import ingest_feed_from_url
+        from app.models.source import Source
+
+        feed_url = "https://example.com/unreachable.xml"
+
+        with patch(
+            "app.ingestion.feed_client.FeedClient.fetch_feed",
+            side_effect=Exception("Network error"),
+        ):
+            result = ingest_feed_from_url(feed_url)
+
+        assert result["errors"] == 1
+
+        with SessionLocal() as db:
+            source = db.query(Source).filter_by(feed_url=feed_url).one()
+            assert source.is_active is False
+            assert source.error_count == 1
+            assert source.last_error == "Network error"
+
+    def test_failure_recording_errors_do_not_count_twice(self):
+        """Test a failing best-effort error update leaves the count at one."""
+        from app.ingestion.ingest_one import ingest_feed_from_url
+
+        with (
+            patch(
+                "app.ingestion.feed_client.FeedClient.fetch_feed",
+                side_effect=Exception("Network error"),
+            ),
+            patch(
+                "app.ingestion.ingest_one.get_or_create_source",
+                side_effect=KeyError("boom"),
+            ),
+        ):
+            result = ingest_feed_from_url("https://example.com/unreachable.xml")
+
+        assert result["errors"] == 1
+
+    def test_ingest_feeds_bulk_isolates_failing_feed(self):
+        """Test that one feed failing to insert does not lose the others."""
+        import feedparser
+        from sqlalchemy.exc import IntegrityError
+
+        from app.ingestion import ingest_one
+        from app.ingestion.ingest_one import ingest_feeds_bulk
+        from app.ingestion.seeder import get_or_create_source
+
+        feed_file = Path(__file__).parent / "fixtures" / "feeds" / "sample_feed.xml"
+        parsed = feedparser.parse(feed_file.read_bytes())
+        good_url = "https://example.com/good.xml"
+        bad_url = "https://example.com/bad.xml"
+        bad_id = get_or_create_source(bad_url).id
+        real_insert = ingest_one._insert_new_articles
+
+        def failing_insert(db, rows):
+            if any(row["source_id"] == bad_id for row in rows):
+                raise IntegrityError("INSERT", {}, Exception("bad row"))
+            return real_insert(db, rows)
+
+        with (
+            patch(
+                "app.ingestion.feed_client.FeedClient.fetch_feed",
+                side_effect=lambda url: parsed,
+            ),
+            patch(
+                "app.ingestion.ingest_one._insert_new_articles",
+                side_effect=failing_insert,
+            ),
+        ):
+            result = ingest_feeds_bulk([good_url, bad_url])
+
+        assert result["inserted"] >= 10
+        assert result["errors"] == len(parsed.entries)
+
+    def test_ingest_feeds_parallel_sums_per_feed_results(self):
+        """Test per-feed parallel ingestion aggregates each feed's counts."""
+        import feedparser
+
+        from app.ingestion.ingest_one import ingest_feeds_parallel
+
+        feed_file = Path(__file__).parent / "fixtures" / "feeds" / "sample_feed.xml"
+        parsed = feedparser.parse(feed_file.read_bytes())
+
+        def fake_fetch(url):
+            if url.endswith("bad.xml"):
+                raise Exception("Network error")
+            return parsed
+
+        with patch(
+            "app.ingestion.feed_client.FeedClient.fetch_feed", side_effect=fake_fetch
+        ):
+            # One worker: the test database is a single shared connection
+            result = ingest_feeds_parallel(
+                ["https://example.com/good.xml", "https://example.com/bad.xml"],
+                max_workers=1,
+            )
+
+        assert result["parsed"] == len(parsed.entries)
+        assert result["inserted"] >= 10
+        assert result["errors"] == 1
+
 
 class TestCLIIntegration:
     """Test CLI command integration."""
@@ -33,6 +33,41 @@ class TestSSRFProtection:
             with pytest.raises(ValueError, match="SSRF protection"):
                 client.fetch_feed(url)
 
+    def test_blocks_ipv6_and_skips_invalid_networks(self):
+        """Test IPv6 ranges are enforced and invalid CIDRs are ignored."""
+        from app.core.config import settings
+        from app.ingestion.feed_client import FeedClient
+
+        networks = ["not-a-network", "10.0.0.0/8", "fc00::/7"]
+        with patch.object(settings, "blocked_networks", networks):
+            client = FeedClient()
+
+        with pytest.raises(ValueError, match="SSRF protection"):
+            client.validate_url("http://[fd12::1]/feed.xml")
+        with pytest.raises(ValueError, match="SSRF protection"):
+            client.validate_url("http://10.1.2.3/feed.xml")
+        client.validate_url("http://192.168.1.1/feed.xml")
+
+    def test_validation_result_is_cached_per_url(self):
+        """Test that a URL that passed validation is not re-parsed."""
+        from urllib.parse import urlparse
+
+        from app.ingestion.feed_client import FeedClient
+
+        client = FeedClient()
+        with patch(
+            "app.ingestion.feed_client.urlparse", wraps=urlparse
+        ) as mock_urlparse:
+            client.validate_url("https://example.com/feed.xml")
+            client.validate_url("https://example.com/feed.xml")
+
+        assert mock_urlparse.call_count == 1
+
+        # Failures are never cached
+        for _ in range(2):
+            with pytest.raises(ValueError, match="SSRF protection"):
+                client.validate_url("http://10.0.0.1/feed.xml")
+
     def test_allows_public_urls(self):
         """Test that public URLs are allowed."""
         # Test cases for public URLs that should be allowed
@@ -129,6 +164,13 @@ class TestXSSPrevention:
         assert "<script>" not in cleaned
         assert "alert(" not in cleaned
 
+    def test_drops_deeply_nested_tokens(self):
+        """Test that tokens nested past the scrub round cap are dropped."""
+        from app.ingestion.mapper import sanitize_html
+
+        assert sanitize_html("alealert(rt( safe") == "safe"
+        assert sanitize_html("ale" * 5 + "alert(" + "rt(" * 5 + " safe") == ""
+
 
 class TestSQLInjectionPrevention:
     """Test SQL injection prevention."""
@@ -227,34 +269,61 @@ class TestInputValidation:
         """Test that response size limits are enforced."""
         from app.ingestion.feed_client import FeedClient
 
-        client = FeedClient()
-
         # Mock a response that's too large
         with patch("httpx.Client") as mock_client_class:
+            client = FeedClient()
+
             # Simulate 11MB response (over 10MB limit)
             mock_response = Mock()
-            mock_response.content = b"x" * (11 * 1024 * 1024)
             mock_response.headers = {"content-length": str(11 * 1024 * 1024)}
 
-            mock_client = Mock()
-            mock_client.get.return_value = mock_response
-            mock_client_class.return_value.__enter__.return_value = mock_client
+            mock_client = mock_client_class.return_value
+            mock_client.stream.return_value.__enter__.return_value = mock_response
 
             with pytest.raises(ValueError, match="Response too large"):
                 client.fetch_feed("https://example.com/feed.xml")
 
+            # Rejected on the declared size without reading the body
+            mock_response.iter_bytes.assert_not_called()
+
+    def test_response_size_limit_without_content_length(self):
+        """Test that the size cap holds when Content-Length is missing."""
+        from app.ingestion.feed_client import FeedClient
+
+        with patch("httpx.Client") as mock_client_class:
+            client = FeedClient()
+
+            chunks_read = []
+
+            def oversized_body(chunk_size):
+                for _ in range(20):
+                    chunk = b"x" * (1024 * 1024)
+                    chunks_read.append(chunk)
+                    yield chunk
+
+            mock_response = Mock()
+            mock_response.headers = {}
+            mock_response.iter_bytes.side_effect = oversized_body
+
+            mock_client = mock_client_class.return_value
+            mock_client.stream.return_value.__enter__.return_value = mock_response
+
+            with pytest.raises(ValueError, match="Response too large"):
+                client._make_http_request("https://example.com/feed.xml")
+
+            # Reading stops as soon as the 10MB cap is passed
+            assert len(chunks_read) == 11
+
     def test_timeout_enforcement(self):
         """Test that timeouts are properly enforced."""
         import httpx
 
         from app.ingestion.feed_client import FeedClient
 
-        client = FeedClient()
-
         with patch("httpx.Client") as mock_client_class:
-            mock_client = Mock()
-            mock_client_class.return_value.__enter__.return_value = mock_client
-            mock_client.get.side_effect = httpx.TimeoutException("Request timed out")
+            client = FeedClient()
+            mock_client = mock_client_class.return_value
+            mock_client.stream.side_effect = httpx.TimeoutException("Request timed out")
 
             with pytest.raises(TimeoutError):
                 client.fetch_feed("https://slow.example.com/feed.xml")
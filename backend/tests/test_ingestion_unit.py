@@ -104,13 +104,13 @@ class TestSourceSeeding:
         """Test graceful handling of database errors."""
         from app.ingestion.seeder import seed_sources
 
-        # Mock the database session to raise an error on add
+        # Mock the database session to raise an error on execute
         with patch("app.ingestion.seeder.SessionLocal") as mock_session_local:
             mock_session_local.return_value.__enter__.return_value = db_session
             mock_session_local.return_value.__exit__.return_value = None
 
-            # Mock db.add to raise an error before logging
-            db_session.add = Mock(side_effect=Exception("Database error"))
+            # Mock db.execute to raise an error before logging
+            db_session.execute = Mock(side_effect=Exception("Database error"))
 
             with pytest.raises(Exception, match="Database error"):
                 seed_sources(
@@ -127,16 +127,46 @@ class TestSourceSeeding:
 class TestFeedClient:
     """Test feed client functionality."""
 
+    def test_validated_url_cache_expires_and_is_bounded(self):
+        """Test validated URLs are re-checked after the TTL and evicted LRU."""
+        import time
+        from urllib.parse import urlparse
+
+        from app.ingestion.feed_client import _VALIDATED_URL_TTL_SEC, FeedClient
+
+        with patch("httpx.Client"):
+            client = FeedClient()
+
+        url = "https://example.com/feed.xml"
+        with patch("app.ingestion.feed_client.urlparse", wraps=urlparse) as parse:
+            client.validate_url(url)
+            client.validate_url(url)
+            assert parse.call_count == 1
+
+            expired = time.monotonic() + _VALIDATED_URL_TTL_SEC
+            with patch("time.monotonic", return_value=expired):
+                client.validate_url(url)
+            assert parse.call_count == 2
+
+        with patch("app.ingestion.feed_client._VALIDATED_URLS_MAX", 2):
+            for i in range(3):
+                client.validate_url(f"https://example.com/{i}.xml")
+        assert list(client._validated_urls) == [
+            "https://example.com/1.xml",
+            "https://example.com/2.xml",
+        ]
+
     def test_fetch_feed_returns_parsed_content(self):
         """Test that fetch_feed returns feedparser-compatible content."""
         from app.ingestion.feed_client import FeedClient
 
-        client = FeedClient()
-
         with patch("httpx.Client") as mock_client:
+            client = FeedClient()
+
             # Mock RSS content
             mock_response = Mock()
-            mock_response.content = b"""<?xml version="1.0"?>
+            mock_response.iter_bytes.return_value = [
+                b"""<?xml version="1.0"?>
             <rss version="2.0">
                 <channel>
                     <title>Test Feed</title>
@@ -147,15 +177,16 @@ class TestFeedClient:
                     </item>
                 </channel>
             </rss>"""
+            ]
             mock_response.headers = {"content-length": "200"}
             mock_response.status_code = 200
             mock_response.raise_for_status = Mock()  # Don't raise for 200
 
-            # Mock the context manager and the get method
-            mock_client_instance = Mock()
-            mock_client_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__.return_value = mock_client_instance
-            mock_client.return_value.__exit__.return_value = None
+            # Mock the stream() context on the client built in FeedClient.__init__
+            mock_client_instance = mock_client.return_value
+            mock_client_instance.stream.return_value.__enter__.return_value = (
+                mock_response
+            )
 
             feed = client.fetch_feed("https://example.com/feed.xml")
 
@@ -167,26 +198,26 @@ class TestFeedClient:
         """Test that requests include proper User-Agent."""
         from app.ingestion.feed_client import FeedClient
 
-        client = FeedClient()
-
         with patch("httpx.Client") as mock_client:
+            client = FeedClient()
+
             mock_response = Mock()
-            mock_response.content = b"<rss></rss>"
+            mock_response.iter_bytes.return_value = [b"<rss></rss>"]
             mock_response.headers = {"content-length": "20"}
             mock_response.status_code = 200
             mock_response.raise_for_status = Mock()
 
-            # Mock the context manager and the get method
-            mock_client_instance = Mock()
-            mock_client_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__.return_value = mock_client_instance
-            mock_client.return_value.__exit__.return_value = None
+            # Mock the stream() context on the client built in FeedClient.__init__
+            mock_client_instance = mock_client.return_value
+            mock_client_instance.stream.return_value.__enter__.return_value = (
+                mock_response
+            )
 
             client.fetch_feed("https://example.com/feed.xml")
 
-            # Verify get was called with proper headers
-            mock_client_instance.get.assert_called_once()
-            call_kwargs = mock_client_instance.get.call_args[1]
+            # Verify the client was built with proper default headers
+            mock_client_instance.stream.assert_called_once()
+            call_kwargs = mock_client.call_args[1]
             assert "headers" in call_kwargs
             assert "User-Agent" in call_kwargs["headers"]
             assert "YourMorningBriefBot" in call_kwargs["headers"]["User-Agent"]
@@ -195,20 +226,20 @@ class TestFeedClient:
         """Test that requests respect configured timeout."""
         from app.ingestion.feed_client import FeedClient
 
-        client = FeedClient()
-
         with patch("httpx.Client") as mock_client:
+            client = FeedClient()
+
             mock_response = Mock()
-            mock_response.content = b"<rss></rss>"
+            mock_response.iter_bytes.return_value = [b"<rss></rss>"]
             mock_response.headers = {"content-length": "20"}
             mock_response.status_code = 200
             mock_response.raise_for_status = Mock()
 
-            # Mock the context manager and the get method
-            mock_client_instance = Mock()
-            mock_client_instance.get.return_value = mock_response
-            mock_client.return_value.__enter__.return_value = mock_client_instance
-            mock_client.return_value.__exit__.return_value = None
+            # Mock the stream() context on the client built in FeedClient.__init__
+            mock_client_instance = mock_client.return_value
+            mock_client_instance.stream.return_value.__enter__.return_value = (
+                mock_response
+            )
 
             client.fetch_feed("https://example.com/feed.xml")
 
@@ -218,6 +249,118 @@ class TestFeedClient:
             assert "timeout" in call_kwargs
             assert call_kwargs["timeout"] > 0
 
+    def test_http_client_reused_and_closed(self):
+        """Test that one pooled client serves repeated fetches and is closed."""
+        from app.ingestion.feed_client import FeedClient
+
+        with patch("httpx.Client") as mock_client:
+            mock_response = Mock()
+            mock_response.iter_bytes.return_value = [b"<rss></rss>"]
+            mock_response.headers = {"content-length": "20"}
+            mock_response.raise_for_status = Mock()
+            mock_stream = mock_client.return_value.stream
+            mock_stream.return_value.__enter__.return_value = mock_response
+
+            with FeedClient() as client:
+                client.fetch_feed("https://example.com/a.xml")
+                client.fetch_feed("https://example.com/b.xml")
+
+            mock_client.assert_called_once()
+            assert mock_stream.call_count == 2
+            mock_client.return_value.close.assert_called_once()
+
+
+class TestFastParse:
+    """Test the lxml fast-path feed parser."""
+
+    def test_matches_feedparser_on_sample_feed(self):
+        """Test that the lxml path yields the fields feedparser would."""
+        import feedparser
+
+        from app.ingestion.fast_parse import parse_feed
+
+        content = (
+            Path(__file__).parent / "fixtures" / "feeds" / "sample_feed.xml"
+        ).read_bytes()
+
+        fast = parse_feed(content)
+        reference = feedparser.parse(content)
+
+        assert len(fast.entries) == len(reference.entries)
+        for got, expected in zip(fast.entries, reference.entries, strict=True):
+            assert got.title == expected.title
+            assert got.link == expected.link
+            assert got.get("published") == expected.get("published")
+            assert [t.term for t in got.get("tags", [])] == [
+                t.term for t in expected.get("tags", [])
+            ]
+
+    def test_rss_guid_permalink_stands_in_for_link(self):
+        """Test that a permalink guid fills in a missing link, as in feedparser."""
+        import feedparser
+
+        from app.ingestion.fast_parse import parse_feed
+
+        content = (
+            Path(__file__).parent / "fixtures" / "feeds" / "guid_permalink_feed.xml"
+        ).read_bytes()
+
+        fast = parse_feed(content)
+        reference = feedparser.parse(content)
+
+        assert [entry.get("link", "") for entry in fast.entries] == [
+            "https://example.com/articles/guid-only",
+            "https://example.com/articles/explicit",
+            "https://example.com/articles/linked",
+            "",
+        ]
+        for got, expected in zip(fast.entries, reference.entries, strict=True):
+            assert got.get("link", "") == expected.get("link", "")
+
+    def test_parses_atom(self):
+        """Test Atom entries map onto feedparser field names."""
+        from app.ingestion.fast_parse import parse_feed
+
+        content = b"""<?xml version="1.0" encoding="utf-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom">
+  <title>Example</title>
+  <entry>
+    <title>Atom Article</title>
+    <link rel="alternate" href="https://example.com/atom/1"/>
+    <summary>Short summary</summary>
+    <author><name>Jane Doe</name></author>
+    <category term="tech"/>
+    <updated>2024-01-15T10:00:00Z</updated>
+  </entry>
+</feed>"""
+
+        feed = parse_feed(content)
+
+        assert feed.feed.title == "Example"
+        entry = feed.entries[0]
+        assert entry.title == "Atom Article"
+        assert entry.link == "https://example.com/atom/1"
+        assert entry.summary == "Short summary"
+        assert entry.author == "Jane Doe"
+        assert entry.tags[0].term == "tech"
+        assert entry.updated == "2024-01-15T10:00:00Z"
+
+    def test_falls_back_to_feedparser_on_malformed_xml(self):
+        """Test that XML lxml rejects is still parsed by feedparser."""
+        import feedparser
+
+        from app.ingestion.fast_parse import parse_feed
+
+        content = b"""<rss version="2.0"><channel><title>Broken &nbsp;</title>
+<item><title>Still Parsed</title><link>https://example.com/1</link></item>
+</channel>"""
+
+        with patch("feedparser.parse", wraps=feedparser.parse) as fp:
+            feed = parse_feed(content)
+
+        fp.assert_called_once_with(content)
+        assert feed.entries[0].title == "Still Parsed"
+
 
 class TestMapper:
     """Test article mapping functionality."""
@@ -248,6 +391,20 @@ class TestMapper:
         assert "content_hash" in article_data
         assert "published_at" in article_data
 
+    def test_extract_tags_dedupes_cleaned_terms(self):
+        """Test tags differing only in markup or whitespace are kept once."""
+        from app.ingestion.mapper import ArticleMapper
+
+        entry = Mock()
+        entry.tags = [
+            Mock(term="tech"),
+            Mock(term="<b>tech</b>"),
+            Mock(term=" tech "),
+            Mock(term="news"),
+        ]
+
+        assert ArticleMapper()._extract_tags(entry) == ["tech", "news"]
+
     def test_map_entry_handles_missing_fields(self):
         """Test mapping handles missing optional fields gracefully."""
         from app.ingestion.mapper import ArticleMapper
@@ -278,6 +435,24 @@ class TestMapper:
         assert "content_hash" in article_data
         assert "published_at" in article_data  # Should have fallback
 
+    def test_map_entries_to_articles_reports_failures(self):
+        """Test batch mapping keeps good entries and reports bad ones."""
+        from app.ingestion.mapper import ArticleMapper
+
+        fields = ["title", "link", "links", "tags"]
+        good = Mock(spec=fields, title="Good", link="https://example.com/good")
+        good.links, good.tags = [], []
+        bad = Mock(spec=fields, title="No Link", link="", links=[], tags=[])
+
+        mapper = ArticleMapper()
+        articles, failures = mapper.map_entries_to_articles([good, bad], source_id=1)
+
+        assert [a["title"] for a in articles] == ["Good"]
+        assert articles[0] == mapper.map_entry_to_article(good, source_id=1)
+        assert len(failures) == 1
+        assert failures[0][0] is bad
+        assert isinstance(failures[0][1], ValueError)
+
     def test_published_at_parsing(self):
         """Test various published date formats are parsed correctly."""
         from app.ingestion.mapper import parse_published_date
@@ -405,3 +580,73 @@ class TestRetryLogic:
         # High retry count should be capped
         delay = calculate_backoff_delay(10, base, jitter, max_delay)
         assert delay <= max_delay
+
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for delay-seconds and HTTP dates."""
+        from app.ingestion.feed_client import parse_retry_after
+
+        assert parse_retry_after("3") == 3.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        # A date in the past means retry immediately
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+    def test_fetch_feed_honors_retry_after(self):
+        """Test that a 503 is retried after the server's Retry-After delay."""
+        import httpx
+
+        from app.ingestion.feed_client import FeedClient
+
+        with (
+            patch("httpx.Client") as mock_client,
+            patch("app.ingestion.feed_client.time.sleep") as mock_sleep,
+        ):
+            client = FeedClient()
+
+            unavailable = Mock()
+            unavailable.headers = {}
+            unavailable.raise_for_status.side_effect = httpx.HTTPStatusError(
+                "Service Unavailable",
+                request=Mock(),
+                response=Mock(status_code=503, headers={"Retry-After": "2"}),
+            )
+            ok = Mock()
+            ok.headers = {}
+            ok.iter_bytes.return_value = [b"<rss></rss>"]
+            ok.raise_for_status = Mock()
+
+            stream = mock_client.return_value.stream
+            stream.return_value.__enter__.side_effect = [unavailable, ok]
+
+            client.fetch_feed("https://example.com/feed.xml")
+
+            mock_sleep.assert_called_once_with(2.0)
+            assert stream.call_count == 2
+
+    def test_fetch_feed_does_not_retry_client_errors(self):
+        """Test that a 404 fails without retrying."""
+        import httpx
+
+        from app.ingestion.feed_client import FeedClient
+
+        with (
+            patch("httpx.Client") as mock_client,
+            patch("app.ingestion.feed_client.time.sleep") as mock_sleep,
+        ):
+            client = FeedClient()
+
+            not_found = Mock()
+            not_found.headers = {}
+            not_found.raise_for_status.side_effect = httpx.HTTPStatusError(
+                "Not Found",
+                request=Mock(),
+                response=Mock(status_code=404, reason_phrase="Not Found"),
+            )
+            stream = mock_client.return_value.stream
+            stream.return_value.__enter__.return_value = not_found
+
+            with pytest.raises(Exception, match="HTTP error 404"):
+                client.fetch_feed("https://example.com/feed.xml")
+
+            mock_sleep.assert_not_called()
+            assert stream.call_count == 1
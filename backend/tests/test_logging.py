@@ -38,6 +38,29 @@ def test_structured_formatter() -> None:
     assert log_data["component"] == "test"
 
 
+def test_structured_formatter_timestamp_is_utc() -> None:
+    """Test that timestamps are rendered in UTC and reused within a second."""
+    formatter = StructuredFormatter(datefmt="%Y-%m-%dT%H:%M:%S")
+    logger = logging.getLogger("test")
+    record = logger.makeRecord(
+        name="test",
+        level=logging.INFO,
+        fn="",
+        lno=0,
+        msg="Test message",
+        args=(),
+        exc_info=None,
+    )
+    record.created = 0.25
+    first = json.loads(formatter.format(record))
+
+    record.created = 0.75
+    second = json.loads(formatter.format(record))
+
+    assert first["timestamp"] == "1970-01-01T00:00:00"
+    assert second["timestamp"] == first["timestamp"]
+
+
 def test_request_id_context() -> None:
     """Test request ID context management."""
     # Initially should be empty
@@ -228,6 +228,24 @@ class TestPublishedDateNormalization:
         # Should be converted to UTC (15:00)
         assert result.hour == 15
 
+    def test_common_formats_skip_dateutil(self):
+        """Test ISO 8601 and RFC 822 dates parse without dateutil."""
+        from unittest.mock import patch
+
+        expected = datetime(2023, 1, 15, 15, 0, tzinfo=UTC)
+        with patch.object(normalization.date_parser, "parse") as dateutil_parse:
+            assert (
+                normalization.normalize_published_date("2023-01-15T10:00:00-05:00")
+                == expected
+            )
+            assert (
+                normalization.normalize_published_date(
+                    "Sun, 15 Jan 2023 10:00:00 -0500"
+                )
+                == expected
+            )
+        dateutil_parse.assert_not_called()
+
     def test_missing_date_fallback(self):
         """Test fallback for missing dates."""
         result = normalization.normalize_published_date(None)